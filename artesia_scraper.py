@@ -5,9 +5,9 @@ This module provides scraping functionality for the City of Artesia bids portal.
 Extracts bid information including scope of work, publication dates, and closing dates.
 
 Key Features:
-    - Selenium-based scraping for dynamic content
+    - Selenium-based scraping for the dynamic listing page
     - Summary table extraction
-    - Detail page scraping for complete information
+    - Concurrent HTTP fetching of static detail pages (Selenium fallback)
     - Date filtering for recent bids
     - Airtable-compatible CSV output
     - Robust error handling and retry logic
@@ -17,6 +17,7 @@ Created: 2025-11-08
 
 Dependencies:
     - selenium: Web automation and browser control
+    - httpx: Concurrent HTTP/2 fetching of detail pages
     - beautifulsoup4: HTML parsing and data extraction
     - pandas: Data manipulation and CSV output
     - webdriver_manager: Automatic ChromeDriver management
@@ -31,16 +32,19 @@ Usage:
 """
 
 # Standard library imports
+import asyncio
+import logging
 import re
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 
 # Third-party imports
+import httpx
 import pandas as pd
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -48,12 +52,14 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 # Local imports
 from utils import (
-    get_chromedriver_path,
+    create_chrome_driver,
     parse_mmddyyyy,
     save_failed_pages_batch,
     save_airtable_format_csv
 )
 
+log = logging.getLogger(__name__)
+
 # =============================================================================
 # CONFIGURATION CONSTANTS
 # =============================================================================
@@ -68,6 +74,105 @@ OUTPUT_CSV = "artesia/artesia_bids.csv"
 MAX_RETRIES = 3
 RETRY_DELAY = 3  # seconds
 
+# Bid fields checked against the date filter
+DATE_FIELDS = ('closing_date', 'publication_date', 'posted_date')
+
+# Airtable Summary field length limit (characters)
+SUMMARY_MAX_LENGTH = 2000
+
+# Detail Page HTTP Configuration
+DETAIL_CONCURRENCY = 10  # Maximum simultaneous detail page requests
+DETAIL_TIMEOUT = 20      # Per-request timeout in seconds
+HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    )
+}
+
+# Parse filter restricting the summary page tree to the bid listing rows
+_SUMMARY_ROWS = SoupStrainer('div', class_='listItemsRow bid')
+
+# CSS selectors for the bid listing rows (soupsieve caches the compiled form)
+_ROW_SEL = 'div.listItemsRow.bid'
+_TITLE_A_SEL = 'div.bidTitle a'
+_STATUS_SPANS_SEL = 'div.bidStatus span'
+
+# Detail page field patterns, compiled once at import time
+_STATUS_RE = re.compile(r'Status:\s*([^\n]+)', re.IGNORECASE)
+
+_MONTH_DATE = r'[A-Z]+\s+\d{1,2},\s*\d{4}'
+_SLASH_DATE = r'\d{1,2}/\d{1,2}/\d{4}'
+
+# Bid field patterns, each capturing only the value. Patterns for a field are
+# listed in priority order (the first pattern that matches anywhere wins).
+_BID_FIELD_PATTERNS = {
+    'bid_number': [r'Bid Number:\s*(?P<value>[^\n]+)'],
+    'project_title': [r'Bid Title:\s*(?P<value>[^\n]+)'],
+    # Publication date (NOTICE section and table structure)
+    'publication_date': [
+        r'Publication\s+Date[:/]Time[:/]\s*(?P<value>' + _MONTH_DATE + ')',
+        r'Publication\s+Date[:/]Time[:/]\s*(?P<value>' + _SLASH_DATE + ')',
+        r'Publication\s+Date[:/]\s*(?P<value>' + _MONTH_DATE + ')',
+        r'Publication\s+Date[:/]\s*(?P<value>' + _SLASH_DATE + ')',
+        r'Posted\s+on:?\s*(?P<value>' + _MONTH_DATE + ')',
+        r'Posted\s+on:?\s*(?P<value>' + _SLASH_DATE + ')',
+        r'NOTICE IS HEREBY GIVEN\s+that(?s:.*?)on\s+(?P<value>' + _MONTH_DATE + ')',
+    ],
+    # Closing date - only the date part is captured
+    'closing_date': [
+        r'up to\s+\d{1,2}:\d{2}\s*[AP]\.?M\.?,\s*(?P<value>' + _MONTH_DATE + ')',
+        r'until\s+\d{1,2}:\d{2}\s*[AP]\.?M\.?,\s*(?P<value>' + _MONTH_DATE + ')',
+        r'\d{1,2}:\d{2}\s*[AP]\.?M\.?,\s*(?P<value>' + _MONTH_DATE + ')',
+        r'(?P<value>' + _MONTH_DATE + ')',  # Just the date part
+        r'(?P<value>' + _SLASH_DATE + ')',  # MM/DD/YYYY format
+    ],
+}
+
+
+def _compile_bid_fields() -> Tuple[re.Pattern, Dict[str, Tuple[str, int]]]:
+    """
+    Combine all bid field patterns into one regex scanned in a single pass.
+
+    The alternation sits inside a lookahead so a match never consumes text
+    that another field's pattern still needs to see.
+
+    Returns:
+        Tuple[re.Pattern, Dict[str, Tuple[str, int]]]: The combined pattern and
+        a map of capture group name to (field, priority)
+    """
+    alternatives = []
+    groups = {}
+    for field, patterns in _BID_FIELD_PATTERNS.items():
+        for priority, pattern in enumerate(patterns):
+            name = f'g{len(groups)}'
+            groups[name] = (field, priority)
+            alternatives.append(pattern.replace('?P<value>', f'?P<{name}>'))
+    return re.compile('(?=' + '|'.join(alternatives) + ')', re.IGNORECASE), groups
+
+
+_BID_FIELDS_RE, _BID_FIELD_GROUPS = _compile_bid_fields()
+
+# Date clean-up patterns
+_DAY_PREFIX_RE = re.compile(
+    r'^(MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\s*', re.IGNORECASE
+)
+_TIME_SUFFIX_RE = re.compile(r'\s+\d{1,2}:\d{2}.*$')
+
+# Label identifying the bid details table on a detail page
+_BID_NUM_HINT_RE = re.compile(r'Bid (?:Number|Title)', re.IGNORECASE)
+
+# Detail page parser: comments and processing instructions are never read,
+# so don't build nodes for them or index element ids
+_DETAIL_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, collect_ids=False)
+_TEXT_NODES = etree.XPath('//text()')
+
+# Page chrome dropped from detail pages before reading their text
+_STRIP_TAGS = {'script', 'style', 'nav', 'header', 'footer'}
+
+# Content whitespace normalization patterns
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
 
 # =============================================================================
 # CORE SCRAPING FUNCTIONS
@@ -90,9 +195,10 @@ def extract_summary_table(driver) -> List[Dict[str, str]]:
         This function extracts what's visible in the overview. Full details
         require visiting individual bid pages.
     """
-    print("📋 Extracting summary table data...")
+    log.info("📋 Extracting summary table data...")
 
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
+    # Only build the tree for the bid rows; the rest of the page is never read
+    soup = BeautifulSoup(driver.page_source, 'lxml', parse_only=_SUMMARY_ROWS)
     items = []
 
     # Look for all bid rows in the structure we identified:
@@ -106,53 +212,38 @@ def extract_summary_table(driver) -> List[Dict[str, str]]:
     #   </div>
     # </div>
     
-    bid_rows = soup.find_all('div', class_='listItemsRow bid')
-    print(f"✓ Found {len(bid_rows)} bid rows")
+    bid_rows = soup.select(_ROW_SEL)
+    log.info("✓ Found %d bid rows", len(bid_rows))
     
     for idx, bid_row in enumerate(bid_rows):
         try:
             # Extract bid title and link
-            bid_title_div = bid_row.find('div', class_='bidTitle')
-            if not bid_title_div:
-                print(f"  ⚠️  Row {idx}: No bidTitle div found")
-                continue
-            
-            # Get the main title link
-            title_link = bid_title_div.find('a')
+            title_link = bid_row.select_one(_TITLE_A_SEL)
             if not title_link:
-                print(f"  ⚠️  Row {idx}: No title link found")
+                log.warning("⚠️  Row %d: No title link found", idx)
                 continue
                 
             title = title_link.get_text(strip=True)
             href = title_link.get('href')
-            
-            # Handle relative URLs
-            if href:
-                if href.startswith('http'):
-                    detail_link = href
-                elif href.startswith('/'):
-                    detail_link = f"https://www.cityofartesia.us{href}"
-                else:
-                    detail_link = f"https://www.cityofartesia.us/{href}"
-            else:
-                print(f"  ⚠️  Row {idx}: No href found for {title}")
+            if not href:
+                log.warning("⚠️  Row %d: No href found for %s", idx, title)
                 continue
+
+            # Resolve relative and scheme-relative (//host/...) links
+            detail_link = urljoin(BASE_URL, href)
             
             # Extract status information  
-            bid_status_div = bid_row.find('div', class_='bidStatus')
             status = ""
             closing_date = ""
             
-            if bid_status_div:
-                status_spans = bid_status_div.find_all('span')
-                for span in status_spans:
-                    span_text = span.get_text(strip=True)
-                    # Check for status (Open/Closed)
-                    if span_text.lower() in ['open', 'closed']:
-                        status = span_text
-                    # Check for date (contains / and :)
-                    elif '/' in span_text and ':' in span_text:
-                        closing_date = span_text
+            for span in bid_row.select(_STATUS_SPANS_SEL):
+                span_text = span.get_text(strip=True)
+                # Check for status (Open/Closed)
+                if span_text.lower() in ['open', 'closed']:
+                    status = span_text
+                # Check for date (contains / and :)
+                elif '/' in span_text and ':' in span_text:
+                    closing_date = span_text
             
             # Create record
             record = {
@@ -160,39 +251,116 @@ def extract_summary_table(driver) -> List[Dict[str, str]]:
                 'project_title': title,
                 'status': status,
                 'closing_date': closing_date,
-                'detail_link': detail_link,
-                'raw_data': bid_row.get_text(separator=' | ', strip=True)
+                'detail_link': detail_link
             }
             
             items.append(record)
-            print(f"  ✓ Extracted: {title} -> {detail_link}")
+            log.debug("✓ Extracted: %s -> %s", title, detail_link)
             
         except Exception as e:
-            print(f"  ✗ Error parsing bid row {idx}: {e}")
+            log.error("✗ Error parsing bid row %d: %s", idx, e)
             continue
     
-    print(f"✓ Extracted {len(items)} summary records\n")
+    log.info("✓ Extracted %d summary records", len(items))
 
     # Show sample of first record for debugging
     if items:
-        print(f"📝 Sample record (first row):")
+        log.debug("📝 Sample record (first row):")
         for key, value in list(items[0].items())[:5]:
-            print(f"   • {key}: {value}")
-        print()
+            log.debug("   • %s: %s", key, value)
 
     return items
 
 
-def extract_detail_page(driver, detail_url: str) -> Dict[str, str]:
+def _scan_bid_fields(text: str) -> Dict[str, str]:
+    """
+    Find bid number, title, publication date and closing date in one pass.
+
+    Args:
+        text (str): Text content to scan (a table or the whole page)
+
+    Returns:
+        Dict[str, str]: Cleaned value of the highest-priority match for each
+        field found in the text
     """
-    Extract detailed bid information from individual bid detail page.
+    best = {}
+    for match in _BID_FIELDS_RE.finditer(text):
+        field, priority = _BID_FIELD_GROUPS[match.lastgroup]
+        if field not in best or priority < best[field][0]:
+            best[field] = (priority, match.group(match.lastgroup))
+
+    fields = {}
+    for field, (_, value) in best.items():
+        value = value.strip()
+        if field in ('closing_date', 'publication_date'):
+            # Clean up the date (remove day names, time stamps)
+            value = _DAY_PREFIX_RE.sub('', value)
+            if field == 'publication_date':
+                value = _TIME_SUFFIX_RE.sub('', value)  # Remove time portion
+        fields[field] = value
+    return fields
+
+
+def _element_text(element) -> str:
+    """
+    Join the stripped, non-empty text nodes under an element, one per line.
 
-    Navigates to the bid detail page and scrapes comprehensive information
-    from the table structure, including full description, publication date,
-    and closing date from the structured content.
+    Matches BeautifulSoup's ``get_text(separator='\\n', strip=True)``.
 
     Args:
-        driver: Selenium WebDriver instance
+        element: lxml element to read
+
+    Returns:
+        str: Newline-separated visible text
+    """
+    return '\n'.join(text for text in map(str.strip, element.itertext()) if text)
+
+
+def _find_bid_table(tree):
+    """
+    Locate the table holding the bid fields via its first field label.
+
+    Args:
+        tree: Parsed detail page document
+
+    Returns:
+        Optional[lxml.html.HtmlElement]: Innermost table around the label,
+        or None if the page has no labelled bid table
+
+    Example:
+        A label mentioned in text outside any table is skipped:
+
+        >>> tree = lxml.html.fromstring(
+        ...     '<div><p>Please reference the Bid Number on all correspondence.</p>'
+        ...     '<table class="bidInfo"><tr><td>Bid Number:</td><td>2025-07</td></tr></table></div>')
+        >>> _find_bid_table(tree).get('class')
+        'bidInfo'
+    """
+    for text in _TEXT_NODES(tree):
+        if _BID_NUM_HINT_RE.search(text):
+            # Tail text belongs to the parent of the element it follows
+            parent = text.getparent()
+            if text.is_tail:
+                parent = parent.getparent()
+            if parent.tag == 'table':
+                return parent
+            table = next(parent.iterancestors('table'), None)
+            if table is not None:
+                return table
+            # Label text outside a table (e.g. intro copy); keep looking
+    return None
+
+
+def parse_detail_html(html: str, detail_url: str) -> Dict[str, str]:
+    """
+    Parse detailed bid information from the HTML of a bid detail page.
+
+    Scrapes comprehensive information from the table structure, including
+    full description, publication date, and closing date from the
+    structured content.
+
+    Args:
+        html (str): Raw HTML of the detail page
         detail_url (str): URL of the detail page
 
     Returns:
@@ -205,135 +373,135 @@ def extract_detail_page(driver, detail_url: str) -> Dict[str, str]:
         - Closing Date/Time
         - Bid title and number
     """
-    print(f"  🔍 Visiting detail page: {detail_url}")
+    tree = lxml.html.document_fromstring(html, parser=_DETAIL_PARSER)
+
+    detail = {
+        'detail_url': detail_url
+    }
+
+    # Extract full page content for Summary (since content is in tables, not BidDetail span)
+    # Remove navigation and script elements, keeping the text that follows them
+    etree.strip_elements(tree, *_STRIP_TAGS, with_tail=False)
+    
+    # Get all visible content
+    full_content = _element_text(tree)
+    
+    # Clean up the content
+    # Collapse every blank-line run to a single blank line (max 2 line breaks)
+    clean_content = _BLANK_LINES_RE.sub('\n\n', full_content)
+    
+    # Use the cleaned content as the Summary (description), capped here at the
+    # Airtable limit so the full page text is not carried through the pipeline
+    detail['summary'] = clean_content[:SUMMARY_MAX_LENGTH]
+    
+    log.debug("✓ Extracted full content - Summary length: %d", len(detail['summary']))
+    
+    # Extract specific fields from the bid details table, located directly
+    # through its "Bid Number"/"Bid Title" label instead of scanning every table
+    bid_table = _find_bid_table(tree)
+    if bid_table is not None:
+        detail.update(_scan_bid_fields(_element_text(bid_table)))
+    
+    # If not found in the table, try full content
+    if 'publication_date' not in detail:
+        publication_date = _scan_bid_fields(full_content).get('publication_date')
+        if publication_date:
+            detail['publication_date'] = publication_date
+    
+    # Extract status from content
+    status_match = _STATUS_RE.search(full_content)
+    if status_match:
+        detail['status'] = status_match.group(1).strip()
+
+    return detail
+
+
+def extract_detail_page(driver, detail_url: str) -> Dict[str, str]:
+    """
+    Extract detailed bid information by loading the detail page in Selenium.
+
+    Used as a fallback when the plain HTTP fetch of a detail page fails.
+
+    Args:
+        driver: Selenium WebDriver instance
+        detail_url (str): URL of the detail page
+
+    Returns:
+        Dict[str, str]: Detailed bid information, or a dict with an 'error'
+        key if the page could not be loaded or parsed
+    """
+    log.debug("🔍 Visiting detail page: %s", detail_url)
 
     try:
         driver.get(detail_url)
 
-        # Wait for page to load and give time for dynamic content
-        time.sleep(5)
-
-        # Wait for main content
+        # Wait for the bid information table rather than a fixed delay
         try:
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+                EC.presence_of_element_located((By.XPATH, "//table//*[contains(text(), 'Bid Number')]"))
             )
         except TimeoutException:
-            print("  ⚠️  Page load timeout")
-
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-        detail = {
-            'detail_url': detail_url
-        }
+            log.warning("⚠️  Page load timeout: %s", detail_url)
 
-        # Extract full page content for Summary (since content is in tables, not BidDetail span)
-        # Remove navigation and script elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer']):
-            element.decompose()
-        
-        # Get all visible content
-        full_content = soup.get_text(separator='\n', strip=True)
-        
-        # Clean up the content
-        clean_content = re.sub(r'\n\s*\n', '\n\n', full_content)  # Normalize double line breaks
-        clean_content = re.sub(r'\n{3,}', '\n\n', clean_content)  # Limit to max 2 line breaks
-        
-        # Use the cleaned content as the Summary (description)
-        detail['summary'] = clean_content
-        
-        print(f"  ✓ Extracted full content - Summary length: {len(detail['summary'])}")
-        
-        # Extract specific fields from tables and content
-        tables = soup.find_all('table')
-        
-        # Look for the main bid information table
-        for table in tables:
-            table_text = table.get_text(separator='\n', strip=True)
-            
-            # Extract bid number
-            bid_num_match = re.search(r'Bid Number:\s*([^\n]+)', table_text, re.IGNORECASE)
-            if bid_num_match:
-                detail['bid_number'] = bid_num_match.group(1).strip()
-            
-            # Extract project title  
-            title_match = re.search(r'Bid Title:\s*([^\n]+)', table_text, re.IGNORECASE)
-            if title_match:
-                detail['project_title'] = title_match.group(1).strip()
-                
-            # Extract closing date - look for date patterns and extract only the date part
-            closing_patterns = [
-                r'up to\s+\d{1,2}:\d{2}\s*[AP]\.?M\.?,\s*([A-Z]+\s+\d{1,2},\s*\d{4})',
-                r'until\s+\d{1,2}:\d{2}\s*[AP]\.?M\.?,\s*([A-Z]+\s+\d{1,2},\s*\d{4})',
-                r'\d{1,2}:\d{2}\s*[AP]\.?M\.?,\s*([A-Z]+\s+\d{1,2},\s*\d{4})',
-                r'([A-Z]+\s+\d{1,2},\s*\d{4})',  # Just the date part
-                r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY format
-            ]
-            
-            for pattern in closing_patterns:
-                closing_match = re.search(pattern, table_text, re.IGNORECASE)
-                if closing_match:
-                    date_text = closing_match.group(1).strip()
-                    # Clean up the date (remove day names, extra text)
-                    date_text = re.sub(r'^(MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\s*', '', date_text, flags=re.IGNORECASE)
-                    detail['closing_date'] = date_text
-                    break
-        
-        # Extract publication date from the full content and tables
-        # Look for patterns in the NOTICE section and table structure
-        pub_patterns = [
-            r'Publication\s+Date[:/]Time[:/]\s*([A-Z]+\s+\d{1,2},\s*\d{4})',
-            r'Publication\s+Date[:/]Time[:/]\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'Publication\s+Date[:/]\s*([A-Z]+\s+\d{1,2},\s*\d{4})',
-            r'Publication\s+Date[:/]\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'Posted\s+on:?\s*([A-Z]+\s+\d{1,2},\s*\d{4})',
-            r'Posted\s+on:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'NOTICE IS HEREBY GIVEN\s+that.*?on\s+([A-Z]+\s+\d{1,2},\s*\d{4})',
-        ]
-        
-        # First try to extract from tables (more structured)
-        for table in tables:
-            table_text = table.get_text(separator='\n', strip=True)
-            
-            # Look for "Publication Date/Time:" pattern in table and extract only date part
-            for pattern in pub_patterns:
-                pub_match = re.search(pattern, table_text, re.IGNORECASE | re.DOTALL)
-                if pub_match:
-                    date_text = pub_match.group(1).strip()
-                    # Clean up the date (remove day names, time stamps)
-                    date_text = re.sub(r'^(MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\s*', '', date_text, flags=re.IGNORECASE)
-                    date_text = re.sub(r'\s+\d{1,2}:\d{2}.*$', '', date_text)  # Remove time portion
-                    detail['publication_date'] = date_text
-                    break
-            
-            if 'publication_date' in detail:
-                break
-        
-        # If not found in tables, try full content
-        if 'publication_date' not in detail:
-            for pattern in pub_patterns:
-                pub_match = re.search(pattern, full_content, re.IGNORECASE | re.DOTALL)
-                if pub_match:
-                    date_text = pub_match.group(1).strip()
-                    # Clean up the date (remove day names, time stamps)
-                    date_text = re.sub(r'^(MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\s*', '', date_text, flags=re.IGNORECASE)
-                    date_text = re.sub(r'\s+\d{1,2}:\d{2}.*$', '', date_text)  # Remove time portion
-                    detail['publication_date'] = date_text
-                    break
-        
-        # Extract status from content
-        status_match = re.search(r'Status:\s*([^\n]+)', full_content, re.IGNORECASE)
-        if status_match:
-            detail['status'] = status_match.group(1).strip()
-
-        return detail
+        return parse_detail_html(driver.page_source, detail_url)
 
     except Exception as e:
-        print(f"  ✗ Error extracting detail page: {e}")
+        log.error("✗ Error extracting detail page %s: %s", detail_url, e)
         return {'detail_url': detail_url, 'error': str(e)}
 
 
-def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
+async def fetch_detail(client: httpx.AsyncClient, url: str) -> Dict[str, str]:
+    """
+    Fetch a bid detail page over plain HTTP and parse it.
+
+    Detail pages are static HTML, so no browser is needed for this step.
+
+    Args:
+        client (httpx.AsyncClient): Shared pooled HTTP client
+        url (str): URL of the detail page
+
+    Returns:
+        Dict[str, str]: Detailed bid information from parse_detail_html()
+
+    Raises:
+        httpx.HTTPStatusError: If the page returns an error status
+        httpx.HTTPError: If the request fails or exceeds DETAIL_TIMEOUT
+    """
+    response = await client.get(url)
+    response.raise_for_status()
+    return parse_detail_html(response.text, url)
+
+
+async def _gather(urls: List[str]) -> List[Union[Dict[str, str], BaseException]]:
+    """
+    Fetch all detail pages concurrently, bounded by DETAIL_CONCURRENCY.
+
+    One client is used for the whole batch so requests share pooled
+    keep-alive connections, multiplexed over HTTP/2 when the server
+    negotiates it (HTTP/1.1 otherwise).
+
+    Args:
+        urls (List[str]): Detail page URLs
+
+    Returns:
+        List[Union[Dict[str, str], BaseException]]: Parsed details in the same
+        order as urls; failed fetches are returned as their exception
+    """
+    semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+    limits = httpx.Limits(max_connections=DETAIL_CONCURRENCY, max_keepalive_connections=DETAIL_CONCURRENCY)
+
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=DETAIL_TIMEOUT,
+                                 headers=HTTP_HEADERS, follow_redirects=True) as client:
+        async def bounded_fetch(url: str) -> Dict[str, str]:
+            async with semaphore:
+                return await fetch_detail(client, url)
+
+        tasks = [bounded_fetch(url) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def scrape_all(date_filter: str = None, driver=None,
+               as_df: bool = True) -> Tuple[Union[pd.DataFrame, List[Dict]], Dict]:
     """
     Scrape City of Artesia bids portal.
 
@@ -342,17 +510,21 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
 
     Args:
         date_filter (str): Date filter in MM/DD/YYYY format (e.g., "01/01/2025")
+        driver (optional): Existing Selenium WebDriver to reuse (e.g. from
+            utils.get_shared_driver()). It is left open; when omitted a new
+            browser is started and quit at the end of the run.
+        as_df (bool): Return the bids as a DataFrame (default, as main.py
+            expects). Pass False to get the plain list of bid dicts and skip
+            building a DataFrame that is only used for its length.
 
     Returns:
-        Tuple[pd.DataFrame, Dict]: DataFrame with all scraped bid data and statistics dictionary
+        Tuple[Union[pd.DataFrame, List[Dict]], Dict]: Scraped bid data and statistics dictionary
 
     Raises:
         WebDriverException: If browser automation fails
         Exception: For other errors during scraping
     """
-    print("\n" + "="*60)
-    print("CITY OF ARTESIA BIDS SCRAPER")
-    print("="*60)
+    log.info("CITY OF ARTESIA BIDS SCRAPER")
 
     all_items = []
     scraping_stats = {
@@ -366,20 +538,13 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
         'total_pages_failed': 0
     }
 
-    # Setup Chrome driver
-    chrome_options = Options()
-    # Uncomment for headless mode
-    # chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-
-    driver = webdriver.Chrome(
-        service=ChromeService(get_chromedriver_path()),
-        options=chrome_options
-    )
+    # Use the caller's browser session if given, otherwise own one for this run
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_chrome_driver()
 
     try:
-        print(f"\n🌐 Loading: {BASE_URL}")
+        log.info("🌐 Loading: %s", BASE_URL)
 
         # Load main page with retry logic
         success = False
@@ -392,12 +557,12 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
 
-                print(f"✓ Page loaded successfully")
+                log.info("✓ Page loaded successfully")
                 success = True
                 break
 
             except TimeoutException:
-                print(f"⚠️  Page load timeout (attempt {attempt + 1}/{MAX_RETRIES})")
+                log.warning("⚠️  Page load timeout (attempt %d/%d)", attempt + 1, MAX_RETRIES)
                 if attempt < MAX_RETRIES - 1:
                     time.sleep(RETRY_DELAY)
                     continue
@@ -407,77 +572,84 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
         if not success:
             raise Exception(f"Failed to load page after {MAX_RETRIES} attempts")
 
-        # Give page extra time to render
-        time.sleep(3)
+        # Wait for the bid listing to render (an empty listing is handled below)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.listItemsRow.bid"))
+            )
+        except TimeoutException:
+            log.warning("⚠️  Bid listing did not appear")
 
         # Extract summary table
         summary_items = extract_summary_table(driver)
 
         if not summary_items:
-            print("⚠️  No bids found in summary table")
+            log.warning("⚠️  No bids found in summary table")
             scraping_stats['skipped_sites'].append({
                 'url': BASE_URL,
                 'reason': 'No bids found in summary table'
             })
-            return pd.DataFrame(), scraping_stats
+            return (pd.DataFrame() if as_df else []), scraping_stats
 
-        print(f"✓ Found {len(summary_items)} bids in summary table\n")
+        log.info("✓ Found %d bids in summary table", len(summary_items))
 
         # Filter by date if provided
         if date_filter:
-            print(f"🗓️  Applying date filter: {date_filter}")
+            log.info("🗓️  Applying date filter: %s", date_filter)
             filter_date = parse_mmddyyyy(date_filter)
             if filter_date:
-                # Try to filter based on available date fields
-                filtered_items = []
-                for item in summary_items:
-                    # Check all fields for dates
-                    item_has_recent_date = False
-                    for key, value in item.items():
-                        if 'date' in key.lower() and value:
-                            item_date = parse_mmddyyyy(value)
-                            if item_date and item_date >= filter_date:
-                                item_has_recent_date = True
-                                break
-
-                    if item_has_recent_date:
-                        filtered_items.append(item)
-
-                print(f"✓ Filtered to {len(filtered_items)} bids after {date_filter}")
+                # Keep bids with any known date field on or after the cutoff
+                filtered_items = [
+                    item for item in summary_items
+                    if any((item_date := parse_mmddyyyy(item.get(field, ''))) and item_date >= filter_date
+                           for field in DATE_FIELDS)
+                ]
+
+                log.info("✓ Filtered to %d bids after %s", len(filtered_items), date_filter)
                 summary_items = filtered_items
 
         scraping_stats['total_pages_attempted'] = len(summary_items)
 
-        # Visit each detail page
+        # Detail pages are static HTML, so fetch them all concurrently over
+        # HTTP and only fall back to the browser for pages that fail
+        urls = [item['detail_link'] for item in summary_items if item.get('detail_link')]
+        log.info("🌐 Fetching %d detail pages (concurrency: %d)...", len(urls), DETAIL_CONCURRENCY)
+        fetched_details = dict(zip(urls, asyncio.run(_gather(urls))))
+
         for idx, summary_item in enumerate(summary_items, 1):
             detail_link = summary_item.get('detail_link')
 
             if not detail_link:
-                print(f"⚠️  Bid {idx}: No detail link found, using summary data only")
+                log.warning("⚠️  Bid %d: No detail link found, using summary data only", idx)
                 all_items.append(summary_item)
                 continue
 
-            print(f"\n📄 Processing bid {idx}/{len(summary_items)}")
-
-            # Scrape detail page with retry logic
-            detail_data = None
-            for attempt in range(MAX_RETRIES):
-                try:
-                    detail_data = extract_detail_page(driver, detail_link)
-
-                    if detail_data and not detail_data.get('error'):
-                        break
-
-                except Exception as e:
-                    print(f"  ⚠️  Attempt {attempt + 1} failed: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(RETRY_DELAY)
-                        continue
-                    else:
-                        detail_data = {
-                            'detail_url': detail_link,
-                            'error': str(e)
-                        }
+            log.info("📄 Processing bid %d/%d", idx, len(summary_items))
+
+            detail_data = fetched_details.get(detail_link)
+            if isinstance(detail_data, BaseException):
+                log.warning("⚠️  HTTP fetch failed (%s), retrying in browser", detail_data)
+                detail_data = None
+
+            # Fall back to the browser with retry logic
+            if detail_data is None:
+                for attempt in range(MAX_RETRIES):
+                    try:
+                        detail_data = extract_detail_page(driver, detail_link)
+
+                        if detail_data and not detail_data.get('error'):
+                            break
+
+                    except Exception as e:
+                        log.warning("⚠️  Attempt %d failed: %s", attempt + 1, e)
+                        if attempt < MAX_RETRIES - 1:
+                            time.sleep(RETRY_DELAY)
+                            continue
+                        else:
+                            detail_data = {
+                                'detail_url': detail_link,
+                                'error': str(e)
+                            }
 
             # Combine summary and detail data
             combined_item = {**summary_item, **detail_data} if detail_data else summary_item
@@ -506,33 +678,31 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
             scraping_stats['total_sites_successful'] = 1
 
     except Exception as e:
-        print(f"\n❌ Scraping failed: {e}")
+        log.error("❌ Scraping failed: %s", e)
         scraping_stats['skipped_sites'].append({
             'url': BASE_URL,
             'reason': f'Error: {str(e)[:100]}'
         })
 
     finally:
-        driver.quit()
-        print("\n[INFO] Browser session closed.")
+        if owns_driver:
+            driver.quit()
+            log.info("Browser session closed.")
 
-    # Create DataFrame
     if all_items:
-        df = pd.DataFrame(all_items)
-
         # Save to CSV in Airtable format
-        print(f"\n💾 Saving data to CSV...")
+        log.info("💾 Saving data to CSV...")
 
         # Prepare data for Airtable format
         airtable_data = prepare_airtable_format(all_items)
         save_airtable_format_csv(airtable_data, OUTPUT_CSV, "Artesia")
 
-        print(f"✅ Saved {len(all_items)} records to: {OUTPUT_CSV}")
+        log.info("✅ Saved %d records to: %s", len(all_items), OUTPUT_CSV)
 
-        return df, scraping_stats
+        return (pd.DataFrame(all_items) if as_df else all_items), scraping_stats
     else:
-        print("⚠️  No data to save")
-        return pd.DataFrame(), scraping_stats
+        log.warning("⚠️  No data to save")
+        return (pd.DataFrame() if as_df else []), scraping_stats
 
 
 def prepare_airtable_format(items: List[Dict]) -> List[Dict]:
@@ -559,48 +729,29 @@ def prepare_airtable_format(items: List[Dict]) -> List[Dict]:
     current_timestamp = datetime.now().strftime('%Y-%m-%d')
 
     for item in items:
+        g = item.get
+
         # Extract project name from various possible fields
-        project_name = (
-            item.get('project_title') or
-            item.get('bid_title') or
-            item.get('title') or
-            item.get('name') or
-            'Unnamed Project'
-        )
-
-        # Extract summary - prioritize the detailed 'summary' field from detail page
+        project_name = g('project_title') or g('bid_title') or g('title') or g('name') or 'Unnamed Project'
+
+        # Extract summary - prioritize the detailed 'summary' field from detail page,
+        # limited for Airtable (slicing past the end is a no-op)
         summary = (
-            item.get('summary') or           # Full description from detail page
-            item.get('scope_of_work') or
-            item.get('description') or
-            item.get('raw_data') or
-            'No description available'
-        )
+            g('summary') or g('scope_of_work') or g('description') or 'No description available'
+        )[:SUMMARY_MAX_LENGTH]
 
         # Extract publication date
-        published_date = (
-            item.get('publication_date') or
-            item.get('posted_date') or
-            item.get('post_date') or
-            item.get('published') or
-            ''
-        )
+        published_date = g('publication_date') or g('posted_date') or g('post_date') or g('published') or ''
 
         # Extract closing/due date
-        due_date = (
-            item.get('closing_date') or
-            item.get('due_date') or
-            item.get('deadline') or
-            item.get('close_date') or
-            ''
-        )
+        due_date = g('closing_date') or g('due_date') or g('deadline') or g('close_date') or ''
 
         # Extract link - use detail link if available, otherwise base URL
-        link = item.get('detail_url') or item.get('detail_link') or BASE_URL
+        link = g('detail_url') or g('detail_link') or BASE_URL
 
         record = {
             'Project Name': project_name,
-            'Summary': summary[:2000] if len(summary) > 2000 else summary,  # Limit length for Airtable
+            'Summary': summary,
             'Published Date': published_date,
             'Due Date': due_date,
             'Link': link,
@@ -678,9 +829,15 @@ def main() -> None:
 
     Orchestrates the scraping workflow and saves results.
     """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] [%(levelname)s] %(message)s',
+        datefmt='%H:%M:%S'
+    )
+
     try:
         # Scrape all bids
-        df, stats = scrape_all()
+        bids, stats = scrape_all(as_df=False)
 
         # Display report
         display_scraping_report(stats)
@@ -689,15 +846,15 @@ def main() -> None:
         if stats['failed_pages']:
             save_failed_pages_batch(stats['failed_pages'], 'Artesia')
 
-        if not df.empty:
+        if bids:
             print(f"\n🎉 SCRAPING COMPLETED SUCCESSFULLY!")
             print(f"   Data saved to: {OUTPUT_CSV}")
-            print(f"   Total records: {len(df)}")
+            print(f"   Total records: {len(bids)}")
         else:
             print(f"\n⚠️  SCRAPING COMPLETED WITH NO DATA")
 
         # Print portal summary
-        print_portal_summary(len(df), 'Artesia')
+        print_portal_summary(len(bids), 'Artesia')
 
     except KeyboardInterrupt:
         print("\n\n✗ Scraping cancelled by user")
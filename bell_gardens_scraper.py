@@ -9,30 +9,35 @@ Author: Assistant
 Created: 2025-11-08
 """
 
+import hashlib
+import logging
 import os
 import re
+import shelve
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
+import requests
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from datetime import datetime
 from typing import List, Dict, Tuple
 from urllib.parse import urljoin
 
 # Local imports
 from utils import (
-    get_chromedriver_path,
+    create_chrome_driver,
     parse_mmddyyyy,
     save_failed_pages_batch,
     save_airtable_format_csv
 )
 
+log = logging.getLogger(__name__)
+
 
 # =============================================================================
 # CONFIGURATION
@@ -45,6 +50,66 @@ OUTPUT_CSV = "bell_gardens/bell_gardens_bids.csv"
 MAX_RETRIES = 3
 RETRY_DELAY = 3  # seconds
 
+# Resources the browser never needs to download (only the HTML is read)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.woff', '*.woff2', '*.css',
+    '*googletagmanager*', '*google-analytics*'
+]
+
+# Listing statuses whose bids are skipped unless include_closed=True
+CLOSED_STATUSES = frozenset({'closed', 'awarded', 'cancelled', 'expired'})
+
+# Detail Page HTTP Configuration
+DETAIL_TIMEOUT = 20  # Per-request timeout in seconds
+DETAIL_WORKERS = 4   # Simultaneous detail page requests (kept polite)
+
+# Parsed detail pages are cached on disk between runs
+DETAIL_CACHE_PATH = "bell_gardens/.detail_cache"
+DETAIL_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+# Placeholder summary for detail pages with no description (never cached)
+NO_DESCRIPTION = 'No detailed description available'
+HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    )
+}
+
+# Whitespace collapsing and MM/DD/YYYY date extraction patterns
+_WS_RE = re.compile(r'\s+')
+_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+
+# Detail page description blocks in priority order: the first main, article
+# and content_area blocks, then any div/section whose class mentions
+# 'content' (case-insensitive). The first block with enough text wins.
+# Compiled once at import; lxml serializes evaluation, so the detail fetch
+# threads can share them.
+_DESCRIPTION_XPATHS = (
+    etree.XPath("(//main)[1]"),
+    etree.XPath("(//article)[1]"),
+    etree.XPath("(//div[contains(concat(' ', normalize-space(@class), ' '), ' content_area ')])[1]"),
+    etree.XPath(
+        "//*[self::div or self::section]"
+        "[contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'content')]"
+    ),
+)
+MIN_DESCRIPTION_LENGTH = 100  # characters
+
+# Overview page parser, reused across calls: comments and processing
+# instructions are never read, so no nodes are built for them
+_SUMMARY_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, collect_ids=False)
+
+
+def _node_text(element) -> str:
+    """Join an element's stripped text nodes with spaces (BeautifulSoup get_text(' ', strip=True))."""
+    return ' '.join(text for text in map(str.strip, element.itertext()) if text)
+
+
+def _cell_text(element) -> str:
+    """Concatenate an element's stripped text nodes (BeautifulSoup get_text(strip=True))."""
+    return ''.join(text.strip() for text in element.itertext())
+
 
 def extract_summary_table(driver) -> List[Dict]:
     """
@@ -53,51 +118,60 @@ def extract_summary_table(driver) -> List[Dict]:
     Returns:
         List[Dict]: List of basic bid information from overview table
     """
-    print("📋 Extracting bid listings from table...")
+    log.info("📋 Extracting bid listings from table...")
     bids = []
     
+    # Wait for the first bid row to render (a missing table is reported below)
     try:
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        # Find the bids table
-        table = soup.find('table', class_='listtable')
-        if not table:
-            print("  ⚠️  No bids table found")
+        WebDriverWait(driver, 15).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "table.listtable tbody tr"))
+        )
+    except TimeoutException:
+        log.warning("⚠️  Bid rows did not appear")
+    
+    try:
+        # Find the bids table and transfer/parse only its markup rather than
+        # the whole serialized page
+        try:
+            table_html = driver.find_element(By.CSS_SELECTOR, "table.listtable").get_attribute('outerHTML')
+        except NoSuchElementException:
+            log.warning("⚠️  No bids table found")
             return bids
+        table = lxml.html.fragment_fromstring(table_html, parser=_SUMMARY_PARSER)
             
         # Find table body rows (skip header)
-        tbody = table.find('tbody')
-        if not tbody:
-            print("  ⚠️  No table body found")
+        tbody = table.find('.//tbody')
+        if tbody is None:
+            log.warning("⚠️  No table body found")
             return bids
             
-        rows = tbody.find_all('tr')
-        print(f"  📋 Found {len(rows)} bid rows")
+        rows = list(tbody.iter('tr'))
+        log.info("📋 Found %d bid rows", len(rows))
         
         for i, row in enumerate(rows, 1):
             try:
-                cells = row.find_all('td')
+                cells = list(row.iter('td'))
                 if len(cells) < 4:
                     continue
                     
                 # Extract title and link (first cell)
                 title_cell = cells[0]
-                link_elem = title_cell.find('a')
-                if not link_elem:
+                link_elem = title_cell.find('.//a')
+                if link_elem is None:
                     continue
                     
-                title = link_elem.get_text(strip=True)
+                title = _cell_text(link_elem)
                 relative_url = link_elem.get('href')
                 detail_url = urljoin(BASE_URL, relative_url) if relative_url else ""
                 
                 # Extract starting date (second cell)
-                starting_date = cells[1].get_text(strip=True) if len(cells) > 1 else ""
+                starting_date = _cell_text(cells[1]) if len(cells) > 1 else ""
                 
                 # Extract closing date (third cell)  
-                closing_date = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+                closing_date = _cell_text(cells[2]) if len(cells) > 2 else ""
                 
                 # Extract status (fourth cell)
-                status = cells[3].get_text(strip=True) if len(cells) > 3 else ""
+                status = _cell_text(cells[3]) if len(cells) > 3 else ""
                 
                 bid_data = {
                     'project_title': title,
@@ -109,22 +183,116 @@ def extract_summary_table(driver) -> List[Dict]:
                 }
                 
                 bids.append(bid_data)
-                print(f"  ✓ Extracted: {title[:60]}...")
+                log.debug("✓ Extracted: %.60s...", title)
                 
             except Exception as e:
-                print(f"  ✗ Error parsing row {i}: {e}")
+                log.error("✗ Error parsing row %d: %s", i, e)
                 continue
                 
     except Exception as e:
-        print(f"❌ Error extracting summary table: {e}")
+        log.error("❌ Error extracting summary table: %s", e)
         
     return bids
 
 
+def _detail_cache_key(detail_url: str, due_date: str, status: str) -> str:
+    """
+    Build the detail cache key for a bid page.
+    
+    The listing's closing date and status are part of the key, so a bid that
+    is revised (an addendum, a new deadline, or a status change) is fetched
+    again instead of being served from the cache.
+    
+    Args:
+        detail_url: URL of the bid detail page
+        due_date: Closing date shown on the listing row
+        status: Status shown on the listing row
+        
+    Returns:
+        str: SHA-1 hex digest of the URL, closing date and status
+    """
+    return hashlib.sha1(f"{detail_url}|{due_date}|{status}".encode()).hexdigest()
+
+
+def parse_detail_html(html, detail_url: str) -> Dict[str, str]:
+    """
+    Parse detailed information from the HTML of a Bell Gardens bid page.
+    
+    Args:
+        html: Raw page HTML (str or bytes)
+        detail_url: URL of the detail page
+        
+    Returns:
+        dict: Detailed bid information including scope of work
+    """
+    doc = lxml.html.document_fromstring(html)
+    
+    detail = {
+        'detail_url': detail_url
+    }
+    
+    # Remove navigation and script elements, keeping the text that follows them
+    etree.strip_elements(doc, 'script', 'style', 'nav', 'header', 'footer', with_tail=False)
+    
+    # Take the first substantial content block in priority order
+    description = ''
+    for find_blocks in _DESCRIPTION_XPATHS:
+        for block in find_blocks(doc):
+            text = _node_text(block)
+            if len(text) > MIN_DESCRIPTION_LENGTH:
+                description = text
+                break
+        if description:
+            break
+    
+    # If still no content, try to get all visible text
+    if not description:
+        body_text = _node_text(doc)
+        if len(body_text) > MIN_DESCRIPTION_LENGTH:
+            description = body_text
+    
+    # Clean description
+    if description:
+        # Clean up whitespace and limit length
+        full_description = _WS_RE.sub(' ', description).strip()
+        detail['scope_of_services'] = full_description[:2000] + "..." if len(full_description) > 2000 else full_description
+    else:
+        detail['scope_of_services'] = NO_DESCRIPTION
+    
+    log.debug("✓ Extracted detail data - Description length: %d", len(detail['scope_of_services']))
+    
+    return detail
+
+
+def fetch_detail_page(session: requests.Session, detail_url: str) -> Dict[str, str]:
+    """
+    Fetch a Bell Gardens bid page over plain HTTP and parse it.
+    
+    Detail pages are static CMS HTML, so no browser is needed; the shared
+    session keeps one keep-alive connection open across all bids.
+    
+    Args:
+        session: Shared requests session (carries the browser's cookies)
+        detail_url: URL to the detail page
+        
+    Returns:
+        dict: Detailed bid information including scope of work
+        
+    Raises:
+        requests.RequestException: If the request fails or returns an error status
+    """
+    log.debug("🔍 Fetching detail page: %s", detail_url)
+    response = session.get(detail_url, timeout=DETAIL_TIMEOUT)
+    response.raise_for_status()
+    return parse_detail_html(response.content, detail_url)
+
+
 def extract_detail_page(driver, detail_url: str) -> Dict[str, str]:
     """
     Extract detailed information from individual Bell Gardens bid page.
     
+    Browser fallback for pages that could not be fetched over HTTP.
+    
     Args:
         driver: Selenium WebDriver instance
         detail_url: URL to the detail page
@@ -132,86 +300,44 @@ def extract_detail_page(driver, detail_url: str) -> Dict[str, str]:
     Returns:
         dict: Detailed bid information including scope of work
     """
-    print(f"  🔍 Visiting detail page: {detail_url}")
+    log.debug("🔍 Visiting detail page: %s", detail_url)
     
     try:
         driver.get(detail_url)
         
-        # Wait for page to load
-        time.sleep(3)
-        
         # Wait for main content
         try:
             WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, "main, article, div.content_area"))
             )
         except TimeoutException:
-            print("  ⚠️  Page load timeout")
-
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        detail = {
-            'detail_url': detail_url
-        }
-        
-        # Extract detailed description from content areas
-        description_parts = []
-        
-        # Remove navigation and script elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer']):
-            element.decompose()
-        
-        # Look for main content areas
-        content_areas = soup.find_all(['div', 'section'], class_=lambda x: x and 'content' in str(x).lower())
-        for area in content_areas:
-            text = area.get_text(separator=' ', strip=True)
-            if text and len(text) > 50:  # Only substantial content
-                description_parts.append(text)
-        
-        # Also look for specific RFP content sections
-        main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content_area')
-        if main_content:
-            text = main_content.get_text(separator=' ', strip=True)
-            if text and len(text) > 50:
-                description_parts.append(text)
-        
-        # If still no content, try to get all visible text
-        if not description_parts:
-            body_text = soup.get_text(separator=' ', strip=True)
-            if body_text and len(body_text) > 100:
-                description_parts.append(body_text)
-        
-        # Combine and clean description
-        if description_parts:
-            full_description = ' '.join(description_parts)
-            # Clean up whitespace and limit length
-            full_description = re.sub(r'\s+', ' ', full_description).strip()
-            detail['scope_of_services'] = full_description[:2000] + "..." if len(full_description) > 2000 else full_description
-        else:
-            detail['scope_of_services'] = 'No detailed description available'
-        
-        print(f"  ✓ Extracted detail data - Description length: {len(detail['scope_of_services'])}")
-        
-        return detail
+            log.warning("⚠️  Page load timeout: %s", detail_url)
+
+        return parse_detail_html(driver.page_source, detail_url)
 
     except Exception as e:
-        print(f"  ✗ Error extracting detail page: {e}")
+        log.error("✗ Error extracting detail page %s: %s", detail_url, e)
         return {'detail_url': detail_url, 'error': str(e)}
 
 
-def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
+def scrape_all(date_filter: str = None, driver=None,
+               include_closed: bool = False) -> Tuple[pd.DataFrame, Dict]:
     """
     Main scraping function for Bell Gardens RFPs/Bids.
     
     Args:
         date_filter: Date filter in MM/DD/YYYY format (optional)
+        driver: Existing Selenium WebDriver to reuse (e.g. from
+            utils.get_shared_driver()). It is left open; when omitted a new
+            browser is started and quit at the end of the run.
+        include_closed: Also scrape bids the listing marks as closed,
+            awarded, cancelled or expired (default: skip them without
+            visiting their detail pages)
         
     Returns:
         Tuple[pd.DataFrame, Dict]: Scraped data and statistics
     """
-    print("\n" + "="*60)
-    print("BELL GARDENS RFP/BIDS SCRAPER")
-    print("="*60)
+    log.info("BELL GARDENS RFP/BIDS SCRAPER")
     
     all_items = []
     scraping_stats = {
@@ -225,22 +351,18 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
         'total_pages_failed': 0
     }
     
-    # Setup Chrome driver
-    chrome_options = Options()
-    # Uncomment for headless mode
-    # chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--page-load-strategy=eager')
-
-    driver = webdriver.Chrome(
-        service=ChromeService(get_chromedriver_path()),
-        options=chrome_options
-    )
+    # Use the caller's browser session if given, otherwise own one for this
+    # run; asset blocking is only applied to a browser this run owns
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_chrome_driver()
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
     
     try:
-        print(f"\n🌐 Loading: {BASE_URL}")
+        log.info("🌐 Loading: %s", BASE_URL)
         
         # Load main page with retry logic
         success = False
@@ -253,12 +375,12 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
                 
-                print(f"✓ Page loaded successfully")
+                log.info("✓ Page loaded successfully")
                 success = True
                 break
                 
             except TimeoutException:
-                print(f"⚠️  Page load timeout (attempt {attempt + 1}/{MAX_RETRIES})")
+                log.warning("⚠️  Page load timeout (attempt %d/%d)", attempt + 1, MAX_RETRIES)
                 if attempt < MAX_RETRIES - 1:
                     time.sleep(RETRY_DELAY)
                     continue
@@ -268,88 +390,126 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
         if not success:
             raise Exception(f"Failed to load page after {MAX_RETRIES} attempts")
         
-        # Give page extra time to render
-        time.sleep(3)
-        
         # Extract bid listings
         bid_items = extract_summary_table(driver)
         
         if not bid_items:
-            print("⚠️  No bids found on overview page")
+            log.warning("⚠️  No bids found on overview page")
             scraping_stats['skipped_sites'].append({
                 'url': BASE_URL,
                 'reason': 'No bids found on overview page'
             })
             return pd.DataFrame(), scraping_stats
         
-        print(f"✓ Found {len(bid_items)} bids on overview page\n")
+        log.info("✓ Found %d bids on overview page", len(bid_items))
+        
+        # Skip bids that are no longer open before any detail page is fetched
+        if not include_closed:
+            bid_items = [item for item in bid_items
+                         if item.get('status', '').strip().lower() not in CLOSED_STATUSES]
+            log.info("✓ %d open bids after skipping closed statuses", len(bid_items))
         
         # Filter by date if provided
         if date_filter:
-            print(f"🗓️  Applying date filter: {date_filter}")
+            log.info("🗓️  Applying date filter: %s", date_filter)
             filter_date = parse_mmddyyyy(date_filter)
             if filter_date:
-                filtered_items = []
-                for item in bid_items:
-                    # Check starting date
-                    item_date = parse_mmddyyyy(item.get('bid_posting_date', ''))
-                    if item_date and item_date >= filter_date:
-                        filtered_items.append(item)
+                # Parse every starting date in one vectorized pass (unparseable -> NaT,
+                # which never passes the comparison)
+                posting_dates = pd.to_datetime(
+                    pd.Series([item.get('bid_posting_date') or '' for item in bid_items], dtype=object).str.strip(),
+                    format='%m/%d/%Y', errors='coerce'
+                )
+                keep = posting_dates >= pd.Timestamp(filter_date)
+                filtered_items = [item for item, ok in zip(bid_items, keep) if ok]
                 
-                print(f"✓ Filtered to {len(filtered_items)} bids after {date_filter}")
+                log.info("✓ Filtered to %d bids after %s", len(filtered_items), date_filter)
                 bid_items = filtered_items
         
         scraping_stats['total_pages_attempted'] = len(bid_items)
         
-        # Visit each detail page
+        # Detail pages are static HTML: fetch them over HTTP with the browser's
+        # cookies and only fall back to the browser for pages that fail
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''))
+        
+        # Each distinct page is fetched once per run, and not at all while its
+        # cached parse (key -> (timestamp, detail)) is fresh
+        cache_keys = {}
+        for item in bid_items:
+            url = item.get('detail_url')
+            if url and url not in cache_keys:
+                cache_keys[url] = _detail_cache_key(url, item.get('bid_due_date', ''), item.get('status', ''))
+        urls = list(cache_keys)
+        fetched_details = {}
+        os.makedirs(os.path.dirname(DETAIL_CACHE_PATH), exist_ok=True)
+        with shelve.open(DETAIL_CACHE_PATH) as cache:
+            now = time.time()
+            for url in urls:
+                cached = cache.get(cache_keys[url])
+                if cached and now - cached[0] < DETAIL_CACHE_TTL:
+                    fetched_details[url] = cached[1]
+            pending = [url for url in urls if url not in fetched_details]
+            
+            log.info("🌐 Fetching %d detail pages (%d cached, %d workers)...",
+                     len(pending), len(fetched_details), DETAIL_WORKERS)
+            with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as pool:
+                futures = {pool.submit(fetch_detail_page, session, url): url for url in pending}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        fetched_details[url] = future.result()
+                        # Only cache pages that parsed to a description, so a blank page is fetched again next run
+                        if fetched_details[url].get('scope_of_services') != NO_DESCRIPTION:
+                            cache[cache_keys[url]] = (time.time(), fetched_details[url])
+                    except Exception as e:
+                        log.warning("⚠️  HTTP fetch failed for %s (%s), will retry in browser", url, e)
+        
+        # Visit each detail page; failures are collected as (url, reason)
+        # and turned into stats entries once at the end
+        failed = []
         for idx, bid_item in enumerate(bid_items, 1):
             detail_link = bid_item.get('detail_url')
             
             if not detail_link:
-                print(f"⚠️  Bid {idx}: No detail link found, using summary data only")
+                log.warning("⚠️  Bid %d: No detail link found, using summary data only", idx)
                 all_items.append(bid_item)
                 continue
             
-            print(f"\n📄 Processing bid {idx}/{len(bid_items)}")
-            print(f"   Title: {bid_item.get('project_title', 'Unknown')[:60]}...")
-            
-            # Scrape detail page with retry logic
-            detail_data = None
-            for attempt in range(MAX_RETRIES):
-                try:
-                    detail_data = extract_detail_page(driver, detail_link)
-                    
-                    if detail_data and not detail_data.get('error'):
-                        break
-                        
-                except Exception as e:
-                    print(f"  ⚠️  Attempt {attempt + 1} failed: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(RETRY_DELAY)
-                        continue
-                    else:
-                        detail_data = {
-                            'detail_url': detail_link,
-                            'error': str(e)
-                        }
+            log.debug("📄 Processing bid %d/%d: %.60s", idx, len(bid_items), bid_item.get('project_title', 'Unknown'))
             
-            # Combine summary and detail data
-            combined_item = {**bid_item, **detail_data} if detail_data else bid_item
+            detail_data = fetched_details.get(detail_link)
             
-            # Add source info
-            combined_item['source_url'] = BASE_URL
-            combined_item['city_name'] = 'Bell Gardens'
+            # Fall back to the browser with retry logic
+            if detail_data is None:
+                for attempt in range(MAX_RETRIES):
+                    try:
+                        detail_data = extract_detail_page(driver, detail_link)
+                        
+                        if detail_data and not detail_data.get('error'):
+                            break
+                            
+                    except Exception as e:
+                        log.warning("⚠️  Attempt %d failed: %s", attempt + 1, e)
+                        if attempt < MAX_RETRIES - 1:
+                            time.sleep(RETRY_DELAY)
+                            continue
+                        else:
+                            detail_data = {
+                                'detail_url': detail_link,
+                                'error': str(e)
+                            }
             
             if detail_data and not detail_data.get('error'):
-                all_items.append(combined_item)
+                # Combine summary and detail data, adding source info
+                all_items.append({**bid_item, **detail_data, 'source_url': BASE_URL, 'city_name': 'Bell Gardens'})
                 scraping_stats['total_bids'] += 1
             else:
                 # Track failed page
-                scraping_stats['failed_pages'].append({
-                    'detail_url': detail_link,
-                    'reason': detail_data.get('error', 'Unknown error') if detail_data else 'No data extracted'
-                })
-                scraping_stats['total_pages_failed'] += 1
+                failed.append((detail_link, detail_data.get('error', 'Unknown error') if detail_data else 'No data extracted'))
+        
+        scraping_stats['failed_pages'] = [{'detail_url': url, 'reason': reason} for url, reason in failed]
+        scraping_stats['total_pages_failed'] = len(failed)
         
         if all_items:
             scraping_stats['successful_sites'].append({
@@ -360,36 +520,62 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
             scraping_stats['total_sites_successful'] = 1
         
     except Exception as e:
-        print(f"\n❌ Scraping failed: {e}")
+        log.error("❌ Scraping failed: %s", e)
         scraping_stats['skipped_sites'].append({
             'url': BASE_URL,
             'reason': f'Error: {str(e)[:100]}'
         })
         
     finally:
-        driver.quit()
-        print("\n[INFO] Browser session closed.")
+        session.close()
+        if owns_driver:
+            driver.quit()
+            log.info("Browser session closed.")
     
     # Create DataFrame
     if all_items:
         df = pd.DataFrame(all_items)
         
         # Save to CSV in Airtable format
-        print(f"\n💾 Saving data to CSV...")
+        log.info("💾 Saving data to CSV...")
         
-        # Prepare data for Airtable format
-        airtable_data = prepare_airtable_format(all_items)
-        save_airtable_format_csv(airtable_data, OUTPUT_CSV, "Bell Gardens")
+        # Prepare data for Airtable format (written straight from the DataFrame)
+        airtable_df = prepare_airtable_format(all_items)
+        save_airtable_format_csv(airtable_df, OUTPUT_CSV, "Bell Gardens")
         
-        print(f"✅ Saved {len(all_items)} records to: {OUTPUT_CSV}")
+        log.info("✅ Saved %d records to: %s", len(all_items), OUTPUT_CSV)
         
         return df, scraping_stats
     else:
-        print("⚠️  No data to save")
+        log.warning("⚠️  No data to save")
         return pd.DataFrame(), scraping_stats
 
 
-def prepare_airtable_format(items: List[Dict]) -> List[Dict]:
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Return a column of df, or an all-missing column if it is absent."""
+    return df[name] if name in df else pd.Series(None, index=df.index, dtype=object)
+
+
+def _first_present(df: pd.DataFrame, names: List[str], default: str) -> pd.Series:
+    """
+    Pick, row by row, the first non-empty value among columns (vectorized `a or b or default`).
+    
+    Args:
+        df (pd.DataFrame): Scraped records
+        names (List[str]): Candidate columns in priority order
+        default (str): Value used when every candidate is missing or empty
+        
+    Returns:
+        pd.Series: Selected values
+    """
+    result = pd.Series(default, index=df.index, dtype=object)
+    for name in reversed(names):
+        values = _column(df, name)
+        result = values.where(values.notna() & (values != ''), result)
+    return result
+
+
+def prepare_airtable_format(items: List[Dict]) -> pd.DataFrame:
     """
     Convert scraped data to Airtable-compatible format.
     
@@ -405,59 +591,30 @@ def prepare_airtable_format(items: List[Dict]) -> List[Dict]:
         items (List[Dict]): Raw scraped bid records
         
     Returns:
-        List[Dict]: Records formatted for Airtable upload
+        pd.DataFrame: Records formatted for Airtable upload, one row per bid
     """
-    from datetime import datetime
+    if not items:
+        return pd.DataFrame()
     
-    airtable_records = []
     current_timestamp = datetime.now().strftime('%Y-%m-%d')
+    df = pd.DataFrame(items)
     
-    for item in items:
-        # Extract project name
-        project_name = (
-            item.get('project_title') or
-            item.get('title') or
-            'Unnamed Project'
-        )
-        
-        # Extract scope/summary
-        summary = (
-            item.get('scope_of_services') or
-            item.get('description') or
-            'No description available'
-        )
-        
-        # Extract publication date - clean to just date part
-        published_date = item.get('bid_posting_date', '')
-        if published_date:
-            # Extract just the date part (remove time if present)
-            date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', published_date)
-            if date_match:
-                published_date = date_match.group(1)
-        
-        # Extract closing/due date - clean to just date part
-        due_date = item.get('bid_due_date', '')
-        if due_date:
-            # Extract just the date part (remove time if present)
-            date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', due_date)
-            if date_match:
-                due_date = date_match.group(1)
-        
-        # Extract link
-        link = item.get('detail_url') or BASE_URL
-        
-        record = {
-            'Project Name': project_name,
-            'Summary': summary[:2000] if len(summary) > 2000 else summary,  # Limit length for Airtable
-            'Published Date': published_date,
-            'Due Date': due_date,
-            'Link': link,
-            'Date Scraped': current_timestamp
-        }
-        
-        airtable_records.append(record)
+    # Published/due dates: keep just the MM/DD/YYYY part (drop any time),
+    # leaving values without a date untouched
+    posting_dates = _column(df, 'bid_posting_date').fillna('')
+    due_dates = _column(df, 'bid_due_date').fillna('')
     
-    return airtable_records
+    airtable_df = pd.DataFrame({
+        'Project Name': _first_present(df, ['project_title', 'title'], 'Unnamed Project'),
+        'Summary': _first_present(df, ['scope_of_services', 'description'],
+                                  'No description available').str.slice(0, 2000),  # Limit length for Airtable
+        'Published Date': posting_dates.str.extract(_DATE_RE, expand=False).fillna(posting_dates),
+        'Due Date': due_dates.str.extract(_DATE_RE, expand=False).fillna(due_dates),
+        'Link': _first_present(df, ['detail_url'], BASE_URL),
+        'Date Scraped': current_timestamp
+    })
+    
+    return airtable_df
 
 
 def display_scraping_report(stats: Dict) -> None:
@@ -526,6 +683,12 @@ def main() -> None:
     
     Orchestrates the scraping workflow and saves results.
     """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] [%(levelname)s] %(message)s',
+        datefmt='%H:%M:%S'
+    )
+
     try:
         # Scrape all bids
         df, stats = scrape_all()
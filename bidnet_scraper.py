@@ -9,6 +9,7 @@ Key Features:
     - SAML authentication handling
     - Summary table data extraction
     - Individual bid page scraping for descriptions
+    - Concurrent detail page fetching over the authenticated session
     - Date filtering for recent bids only
     - CSV output with Airtable-compatible format
     - Robust error handling and retry logic
@@ -19,7 +20,8 @@ Created: 2025-11-09
 Dependencies:
     - selenium: Web automation and browser control
     - undetected-chromedriver: Anti-bot detection browser
-    - beautifulsoup4: HTML parsing and data extraction
+    - beautifulsoup4 + lxml: HTML parsing and data extraction
+    - httpx: Concurrent HTTP/2 fetching of detail pages
     - pandas: Data manipulation and CSV output
 
 Usage:
@@ -29,20 +31,36 @@ Usage:
     
     from bidnet_scraper import scrape_all
     data, stats = scrape_all(date_filter="11/01/2025")
+    
+    or, to handle each bid as soon as it is scraped
+    
+    from bidnet_scraper import scrape_all_stream
+    async for item in scrape_all_stream(stats, date_filter="11/01/2025"):
+        ...
 """
 
 # Standard library imports
+import asyncio
+import atexit
 import csv
+import hashlib
+import logging
 import os
+import queue
 import re
+import shelve
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 # Third-party imports
+import httpx
+import lxml.html
 import pandas as pd
+import soupsieve
 import undetected_chromedriver as uc
 from bs4 import BeautifulSoup
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -53,13 +71,15 @@ from dotenv import load_dotenv
 # Local imports
 from utils import (
     parse_mmddyyyy, 
-    save_failed_pages_batch,
-    save_airtable_format_csv
+    AIRTABLE_CSV_HEADERS,
+    save_failed_pages_batch
 )
 
 # Load environment variables
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 # =============================================================================
 # CONFIGURATION CONSTANTS
 # =============================================================================
@@ -71,6 +91,70 @@ SANTA_CLARITA_URL = "https://www.bidnetdirect.com/california/cityofsantaclarita"
 # Output Configuration
 OUTPUT_CSV = "bidnet/bidnet_santa_clarita_bids.csv"
 
+# Browser Configuration. Headless is opt-in because login falls back to
+# manual intervention in a visible browser window.
+HEADLESS = os.getenv('BIDNET_HEADLESS', '').lower() in ('1', 'true', 'yes')
+
+# Chrome flags that cut startup work (background services, first-run setup)
+LEAN_CHROME_FLAGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-background-networking',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-first-run'
+]
+
+# Resources the browser never needs to download (only the HTML is read)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.woff', '*.woff2',
+    '*googletagmanager*', '*google-analytics*'
+]
+
+# Bid detail page description selectors, in priority order
+DESCRIPTION_SELECTORS = (
+    "#descriptionText",  # Primary selector
+    ".description .mets-field-body",
+    ".wysiwyg",
+    ".mets-ellipsis-wrapper",
+    "[class*='description'] p",
+    ".mets-field-view .mets-field-body"
+)
+DESCRIPTION_WAIT_TIMEOUT = 8  # seconds
+
+# Precompiled XPath for the listing page. Class tests match whole class
+# tokens, the same way CSS class selectors do.
+def _has_class(name: str) -> str:
+    """Build an XPath predicate matching elements that carry the given class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+_LISTING_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, collect_ids=False)
+_TABLE_XPATH = etree.XPath(f"(//*[{_has_class('sol-table')} or {_has_class('mets-table')}])[1]")
+_ROWS_XPATH = etree.XPath(f".//tr[{_has_class('mets-table-row')} and not({_has_class('mets-table-row-empty')})]")
+_SOL_NUM_XPATH = etree.XPath(f"(.//*[{_has_class('sol-num')}])[1]")
+_TITLE_LINK_XPATH = etree.XPath(f"(.//*[{_has_class('sol-title')}]//a)[1]")
+_REGION_XPATH = etree.XPath(f"(.//*[{_has_class('sol-region-item')}])[1]")
+_PUB_DATE_XPATH = etree.XPath(f"(.//*[{_has_class('sol-publication-date')}]//*[{_has_class('date-value')}])[1]")
+_CLOSE_DATE_XPATH = etree.XPath(f"(.//*[{_has_class('sol-closing-date')}]//*[{_has_class('date-value')}])[1]")
+
+# Precompiled patterns for detail page parsing. The description selectors
+# stay separate (not one combined selector) to keep their priority order.
+_DESCRIPTION_SELS = tuple(soupsieve.compile(selector) for selector in DESCRIPTION_SELECTORS)
+_PUB_RE = re.compile(r"Publication", re.I)
+_DATE_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+
+# Detail Page HTTP Configuration
+DETAIL_CONCURRENCY = 8  # Maximum simultaneous detail page requests
+DETAIL_TIMEOUT = 15     # Per-request timeout in seconds
+KEEPALIVE_EXPIRY = 30   # Seconds an idle pooled connection is kept open
+
+# Parsed detail pages are cached on disk between runs
+DETAIL_CACHE_PATH = "bidnet/.detail_cache"
+DETAIL_CACHE_TTL = 7 * 24 * 3600  # seconds
+
 # =============================================================================
 # AUTHENTICATION FUNCTIONS
 # =============================================================================
@@ -216,10 +300,261 @@ def login_to_bidnet(driver) -> bool:
         input(">>> Press ENTER when logged in and ready to continue...\n")
         return True
 
+# =============================================================================
+# BROWSER POOL
+# =============================================================================
+
+# Logged-in browsers kept warm between scrape_all() calls in the same process
+_DRIVER_POOL: "queue.Queue[uc.Chrome]" = queue.Queue()
+
+def _quit_pooled_drivers() -> None:
+    """Quit every browser left in the pool at interpreter exit."""
+    while True:
+        try:
+            _DRIVER_POOL.get_nowait().quit()
+        except queue.Empty:
+            return
+        except WebDriverException:
+            continue
+
+atexit.register(_quit_pooled_drivers)
+
+def build_uc_options() -> uc.ChromeOptions:
+    """
+    Build undetected Chrome options with images, extensions, plugins and
+    notifications disabled since only the page HTML is read, plus
+    LEAN_CHROME_FLAGS for a faster cold start.
+    
+    Returns:
+        uc.ChromeOptions: Options for uc.Chrome (headless when HEADLESS is set)
+    """
+    options = uc.ChromeOptions()
+    if HEADLESS:
+        options.add_argument('--headless=new')
+    for flag in LEAN_CHROME_FLAGS:
+        options.add_argument(flag)
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-plugins')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    # Return from driver.get() at DOMContentLoaded; the pages are server-rendered
+    # and each caller waits for the elements it reads
+    options.page_load_strategy = 'eager'
+    return options
+
+def acquire_driver() -> Optional[uc.Chrome]:
+    """
+    Take a logged-in browser from the pool, starting and logging in a new one if it is empty.
+    
+    Reusing a pooled browser skips the Chrome cold start and the SAML login.
+    
+    Returns:
+        Optional[uc.Chrome]: Logged-in browser, or None if login failed
+    """
+    try:
+        return _DRIVER_POOL.get_nowait()
+    except queue.Empty:
+        pass
+    
+    driver = uc.Chrome(options=build_uc_options(), use_subprocess=False)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    if not login_to_bidnet(driver):
+        driver.quit()
+        return None
+    return driver
+
+def release_driver(driver) -> None:
+    """
+    Return a browser to the pool for the next scrape_all() call.
+    
+    The browser is parked on about:blank, keeping its login cookies. A
+    browser that no longer responds is quit instead of pooled.
+    
+    Args:
+        driver: Browser previously returned by acquire_driver()
+    """
+    try:
+        driver.get("about:blank")
+    except WebDriverException:
+        driver.quit()
+        return
+    _DRIVER_POOL.put(driver)
+
 # =============================================================================
 # SCRAPING FUNCTIONS
 # =============================================================================
 
+def wait_for_description(driver) -> None:
+    """
+    Wait until any description element is present on a bid detail page.
+    
+    On timeout the page is parsed as-is, so this never raises.
+    
+    Args:
+        driver: Selenium WebDriver instance on a bid detail page
+    """
+    try:
+        WebDriverWait(driver, DESCRIPTION_WAIT_TIMEOUT).until(EC.any_of(
+            *(EC.presence_of_element_located((By.CSS_SELECTOR, selector)) for selector in DESCRIPTION_SELECTORS)
+        ))
+    except TimeoutException:
+        log.warning("⚠️  Description not found before timeout, parsing page as loaded")
+
+def _cell_text(element) -> str:
+    """Concatenate an element's stripped text nodes (BeautifulSoup get_text(strip=True))."""
+    return ''.join(text.strip() for text in element.itertext())
+
+def _first_text(xpath: etree.XPath, row) -> str:
+    """Return the text of the first element matched by xpath within row, or ""."""
+    found = xpath(row)
+    return _cell_text(found[0]) if found else ""
+
+def _iter_rows(bid_rows, source_url: str) -> Iterator[Dict[str, str]]:
+    """
+    Yield one summary record per listing row that has a title and number.
+    
+    Args:
+        bid_rows: Listing table row elements
+        source_url: URL of the listing page the rows came from
+        
+    Yields:
+        Dict[str, str]: Summary data for one bid
+    """
+    # One timestamp per listing scrape, shared by all of its rows
+    scraped_at = datetime.now().isoformat()
+    
+    for row in bid_rows:
+        try:
+            # Extract solicitation number
+            solicitation_number = _first_text(_SOL_NUM_XPATH, row)
+            
+            # Extract title and URL
+            title_link = _TITLE_LINK_XPATH(row)
+            if title_link:
+                title_link = title_link[0]
+                title = _cell_text(title_link)
+                detail_href = title_link.get('href', '')
+                # Convert relative URL to absolute
+                if detail_href.startswith('/'):
+                    detail_url = f"https://www.bidnetdirect.com{detail_href}"
+                else:
+                    detail_url = detail_href
+            else:
+                title = ""
+                detail_url = ""
+            
+            # Extract region
+            region = _first_text(_REGION_XPATH, row)
+            
+            # Extract publication date
+            published_date = _first_text(_PUB_DATE_XPATH, row)
+            
+            # Extract closing date  
+            closing_date = _first_text(_CLOSE_DATE_XPATH, row)
+            
+            # Skip if essential fields are missing
+            if not title or not solicitation_number:
+                continue
+            
+            item = {
+                'solicitation_number': solicitation_number,
+                'project_title': title,
+                'region': region,
+                'published_date': published_date,
+                'closing_date': closing_date,
+                'detail_url': detail_url,
+                'source_url': source_url,
+                'scraped_at': scraped_at
+            }
+            
+            log.debug("✓ Extracted: %s - %.50s...", solicitation_number, title)
+            yield item
+            
+        except Exception as e:
+            log.warning("⚠️  Error parsing row: %s", e)
+            continue
+
+def parse_summary_table(table, source_url: str, date_filter: str = None) -> List[Dict[str, str]]:
+    """
+    Extract summary bid data from a parsed listing table.
+    
+    Args:
+        table: The listing's bid table element
+        source_url: URL of the listing page the table came from
+        date_filter: Date filter in MM/DD/YYYY format
+        
+    Returns:
+        List[Dict[str, str]]: List of bid records with summary data
+    """
+    # Find all bid rows (exclude header and empty rows)
+    bid_rows = _ROWS_XPATH(table)
+    log.info("✓ Found %d bid rows", len(bid_rows))
+    
+    # Parse date filter
+    filter_date = None
+    if date_filter:
+        filter_date = parse_mmddyyyy(date_filter)
+        log.info("🗓️  Applying date filter: Only bids from %s onward", date_filter)
+    
+    items = list(_iter_rows(bid_rows, source_url))
+    
+    # Apply date filter in one vectorized pass. Rows with a missing or
+    # unparseable publication date (NaT never compares less) are kept.
+    if filter_date:
+        published = pd.to_datetime(
+            pd.Series([item['published_date'] for item in items], dtype=object),
+            format='%m/%d/%Y', errors='coerce'
+        )
+        keep = ~(published < pd.Timestamp(filter_date))
+        items = [item for item, ok in zip(items, keep) if ok]
+    
+    log.info("✅ Successfully extracted %d summary items", len(items))
+    return items
+
+def fetch_summary_data(cookies: httpx.Cookies, user_agent: str,
+                       date_filter: str = None) -> Optional[List[Dict[str, str]]]:
+    """
+    Fetch and extract the Santa Clarita listing over HTTP, without the browser.
+    
+    The listing is server-rendered, so the logged-in session cookies are
+    enough to read it.
+    
+    Args:
+        cookies: Session cookies copied from the logged-in browser
+        user_agent: Browser user agent, so the request matches the login session
+        date_filter: Date filter in MM/DD/YYYY format
+        
+    Returns:
+        Optional[List[Dict[str, str]]]: Bid records, or None if the response
+        was not the listing (error, login redirect or bot challenge) and the
+        browser should be used instead
+    """
+    log.info("📊 Fetching bid listing page over HTTP...")
+    try:
+        with httpx.Client(http2=True, timeout=DETAIL_TIMEOUT, cookies=cookies,
+                          headers={'User-Agent': user_agent}, follow_redirects=True) as client:
+            response = client.get(SANTA_CLARITA_URL)
+            response.raise_for_status()
+    except httpx.HTTPError as e:
+        log.warning("⚠️  HTTP listing fetch failed (%s), using browser", e)
+        return None
+    
+    if "login" in response.url.path.lower():
+        log.info("🔐 HTTP listing fetch was redirected to login, using browser")
+        return None
+    
+    table = _TABLE_XPATH(lxml.html.document_fromstring(response.text, parser=_LISTING_PARSER))
+    if not table:
+        log.warning("⚠️  No bid table in HTTP response (likely a bot challenge), using browser")
+        return None
+    
+    return parse_summary_table(table[0], str(response.url), date_filter)
+
 def extract_summary_data(driver, date_filter: str = None) -> List[Dict[str, str]]:
     """
     Extract summary bid data from Santa Clarita listing page.
@@ -231,7 +566,7 @@ def extract_summary_data(driver, date_filter: str = None) -> List[Dict[str, str]
     Returns:
         List[Dict[str, str]]: List of bid records with summary data
     """
-    print("📊 Extracting summary data from bid listing page...")
+    log.info("📊 Extracting summary data from bid listing page...")
     
     try:
         # Wait for the bid table to load
@@ -239,94 +574,21 @@ def extract_summary_data(driver, date_filter: str = None) -> List[Dict[str, str]
             EC.presence_of_element_located((By.CSS_SELECTOR, ".sol-table, .mets-table"))
         )
         
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        items = []
+        doc = lxml.html.document_fromstring(driver.page_source, parser=_LISTING_PARSER)
         
         # Find the bid table
-        table = soup.select_one(".sol-table, .mets-table")
+        table = _TABLE_XPATH(doc)
         if not table:
-            print("❌ Could not find bid table")
-            return items
+            log.error("❌ Could not find bid table")
+            return []
         
-        # Find all bid rows (exclude header and empty rows)
-        bid_rows = table.select("tr.mets-table-row:not(.mets-table-row-empty)")
-        print(f"✓ Found {len(bid_rows)} bid rows")
-        
-        # Parse date filter
-        filter_date = None
-        if date_filter:
-            filter_date = parse_mmddyyyy(date_filter)
-            print(f"🗓️  Applying date filter: Only bids from {date_filter} onward")
-        
-        for row in bid_rows:
-            try:
-                # Extract solicitation number
-                sol_num_div = row.select_one(".sol-num")
-                solicitation_number = sol_num_div.get_text(strip=True) if sol_num_div else ""
-                
-                # Extract title and URL
-                title_link = row.select_one(".sol-title a")
-                if title_link:
-                    title = title_link.get_text(strip=True)
-                    detail_href = title_link.get('href', '')
-                    # Convert relative URL to absolute
-                    if detail_href.startswith('/'):
-                        detail_url = f"https://www.bidnetdirect.com{detail_href}"
-                    else:
-                        detail_url = detail_href
-                else:
-                    title = ""
-                    detail_url = ""
-                
-                # Extract region
-                region_span = row.select_one(".sol-region-item")
-                region = region_span.get_text(strip=True) if region_span else ""
-                
-                # Extract publication date
-                pub_date_span = row.select_one(".sol-publication-date .date-value")
-                published_date = pub_date_span.get_text(strip=True) if pub_date_span else ""
-                
-                # Extract closing date  
-                close_date_span = row.select_one(".sol-closing-date .date-value")
-                closing_date = close_date_span.get_text(strip=True) if close_date_span else ""
-                
-                # Apply date filter if specified
-                if filter_date and published_date:
-                    # Convert published_date to datetime for comparison
-                    pub_dt = parse_mmddyyyy(published_date)
-                    if pub_dt and pub_dt < filter_date:
-                        continue
-                
-                # Skip if essential fields are missing
-                if not title or not solicitation_number:
-                    continue
-                
-                item = {
-                    'solicitation_number': solicitation_number,
-                    'project_title': title,
-                    'region': region,
-                    'published_date': published_date,
-                    'closing_date': closing_date,
-                    'detail_url': detail_url,
-                    'source_url': driver.current_url,
-                    'scraped_at': datetime.now().isoformat()
-                }
-                
-                items.append(item)
-                print(f"✓ Extracted: {solicitation_number} - {title[:50]}...")
-                
-            except Exception as e:
-                print(f"⚠️  Error parsing row: {e}")
-                continue
-        
-        print(f"✅ Successfully extracted {len(items)} summary items")
-        return items
+        return parse_summary_table(table[0], driver.current_url, date_filter)
         
     except TimeoutException:
-        print("❌ Timeout waiting for bid table to load")
+        log.error("❌ Timeout waiting for bid table to load")
         return []
     except Exception as e:
-        print(f"❌ Error extracting summary data: {e}")
+        log.error("❌ Error extracting summary data: %s", e)
         return []
 
 def scrape_bid_description(driver, detail_url: str) -> str:
@@ -341,236 +603,404 @@ def scrape_bid_description(driver, detail_url: str) -> str:
         str: The bid description/summary
     """
     try:
-        print(f"  📖 Fetching description from: {detail_url}")
+        log.debug("📖 Fetching description from: %s", detail_url)
         driver.get(detail_url)
         
         # Wait for the description section to load
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
+        wait_for_description(driver)
         
-        time.sleep(2)  # Allow page to fully render
-        
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Look for the description field based on the HTML structure you provided
-        description_selectors = [
-            "#descriptionText",  # Primary selector from your HTML
-            ".description .mets-field-body",
-            ".wysiwyg",
-            ".mets-ellipsis-wrapper",
-            "[class*='description'] p",
-            ".mets-field-view .mets-field-body"
-        ]
+        soup = BeautifulSoup(driver.page_source, "lxml")
         
         description = ""
-        for selector in description_selectors:
-            desc_element = soup.select_one(selector)
+        for selector in _DESCRIPTION_SELS:
+            desc_element = selector.select_one(soup)
             if desc_element:
                 description = desc_element.get_text(strip=True)
                 if description:
-                    print(f"    ✓ Found description ({len(description)} chars)")
+                    log.debug("✓ Found description (%d chars)", len(description))
                     break
         
         # If no description found, try to get any substantial text content
         if not description:
-            # Look for paragraphs with substantial content
-            paragraphs = soup.select("p")
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                if len(text) > 50:  # Substantial content
-                    description = text
-                    break
+            # Look for the first paragraph with substantial content
+            description = next((text for p in soup.find_all("p")
+                                if len(text := p.get_text(" ", strip=True)) > 50), "")
         
         return description[:1000] + "..." if len(description) > 1000 else description
         
     except Exception as e:
-        print(f"    ❌ Error fetching description: {e}")
+        log.error("❌ Error fetching description: %s", e)
         return ""
 
-def scrape_bid_description_and_dates(driver, detail_url: str) -> Tuple[str, Optional[str]]:
+def parse_bid_description_and_dates(html: str, with_date: bool = True) -> Tuple[str, Optional[str]]:
+    """
+    Parse the description and published date out of bid detail page HTML.
+    
+    Args:
+        html: Raw HTML of an individual bid page
+        with_date: Look up the publication date; skipped when the listing
+            already provides it
+        
+    Returns:
+        Tuple[str, Optional[str]]: (description, published_date), with
+        published_date None when not found or not looked up
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    # --- Description extraction (existing logic) ---
+    description = ""
+    for selector in _DESCRIPTION_SELS:
+        desc_element = selector.select_one(soup)
+        if desc_element:
+            description = desc_element.get_text(strip=True)
+            if description:
+                break
+    if not description:
+        # First paragraph with substantial content; words in nested tags stay space-separated
+        description = next((text for p in soup.find_all("p")
+                            if len(text := p.get_text(" ", strip=True)) > 50), "")
+
+    # --- Published date extraction ---
+    published_date = None
+    pub_label = soup.find("span", string=_PUB_RE) if with_date else None
+    if pub_label:
+        pub_body = pub_label.find_next("div", class_="mets-field-body")
+        if pub_body:
+            pub_text = pub_body.get_text(strip=True)
+            match = _DATE_RE.search(pub_text)
+            if match:
+                published_date = match.group(0)
+            else:
+                published_date = pub_text  # fallback: raw text
+
+    return description[:1000] + "..." if len(description) > 1000 else description, published_date
+
+def scrape_bid_description_and_dates(driver, detail_url: str, with_date: bool = True) -> Tuple[str, Optional[str]]:
     """
     Scrape the detailed description and published date from an individual bid page.
-    Returns (description, published_date)
+    Returns (description, published_date); the date is only looked up if with_date
     """
     try:
-        print(f"  📖 Fetching description and dates from: {detail_url}")
+        log.debug("📖 Fetching description and dates from: %s", detail_url)
         driver.get(detail_url)
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        wait_for_description(driver)
+        return parse_bid_description_and_dates(driver.page_source, with_date)
 
-        # --- Description extraction (existing logic) ---
-        description = ""
-        description_selectors = [
-            "#descriptionText", ".description .mets-field-body", ".wysiwyg",
-            ".mets-ellipsis-wrapper", "[class*='description'] p", ".mets-field-view .mets-field-body"
-        ]
-        for selector in description_selectors:
-            desc_element = soup.select_one(selector)
-            if desc_element:
-                description = desc_element.get_text(strip=True)
-                if description:
-                    break
-        if not description:
-            paragraphs = soup.select("p")
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                if len(text) > 50:
-                    description = text
-                    break
+    except Exception as e:
+        log.error("❌ Error fetching description/dates: %s", e)
+        return "", None
 
-        # --- Published date extraction ---
-        published_date = None
-        pub_label = soup.find("span", string=re.compile(r"Publication", re.I))
-        if pub_label:
-            pub_body = pub_label.find_next("div", class_="mets-field-body")
-            if pub_body:
-                pub_text = pub_body.get_text(strip=True)
-                match = re.search(r"\d{2}/\d{2}/\d{4}", pub_text)
-                if match:
-                    published_date = match.group(0)
-                else:
-                    published_date = pub_text  # fallback: raw text
+async def fetch_bid_description_and_dates(client: httpx.AsyncClient, detail_url: str,
+                                          with_date: bool = True) -> Tuple[str, Optional[str]]:
+    """
+    Fetch an individual bid page over the authenticated HTTP session and parse it.
+    
+    Args:
+        client: Shared pooled HTTP client carrying the browser's login cookies
+        detail_url: URL of the individual bid page
+        with_date: Look up the publication date as well as the description
+        
+    Returns:
+        Tuple[str, Optional[str]]: (description, published_date)
+        
+    Raises:
+        httpx.HTTPStatusError: If the page returns an error status
+        httpx.HTTPError: If the request fails or exceeds DETAIL_TIMEOUT
+        PermissionError: If the session was bounced back to the login page
+        ValueError: If the page has no description (e.g. an interstitial, or a
+            page that fills it in with JavaScript), so the browser retries it
+    """
+    response = await client.get(detail_url)
+    response.raise_for_status()
+    if "login" in response.url.path.lower():
+        raise PermissionError(f"Redirected to login page: {response.url}")
+    description, published_date = parse_bid_description_and_dates(response.text, with_date)
+    if not description:
+        raise ValueError("no description in HTTP response")
+    return description, published_date
+
+def _start_detail_fetches(client: httpx.AsyncClient,
+                          pages: Dict[str, bool]) -> Dict[str, "asyncio.Task[Tuple[str, Optional[str]]]"]:
+    """
+    Start fetching bid detail pages concurrently, bounded by DETAIL_CONCURRENCY.
+    
+    Every page goes through the one client, so a connection's TCP and TLS
+    setup is paid once and reused until it has been idle for KEEPALIVE_EXPIRY.
+    Must be called from a running event loop.
+    
+    Args:
+        client: Shared pooled HTTP client from _detail_client()
+        pages: Detail page URL -> whether its publication date is needed
+        
+    Returns:
+        Dict[str, asyncio.Task]: URL -> task resolving to (description,
+        published_date), or raising the fetch error
+    """
+    semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
 
-        return description[:1000] + "..." if len(description) > 1000 else description, published_date
+    async def bounded_fetch(url: str, with_date: bool) -> Tuple[str, Optional[str]]:
+        async with semaphore:
+            return await fetch_bid_description_and_dates(client, url, with_date)
 
-    except Exception as e:
-        print(f"    ❌ Error fetching description/dates: {e}")
-        return "", None
+    return {url: asyncio.ensure_future(bounded_fetch(url, with_date)) for url, with_date in pages.items()}
 
-def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
+def _detail_client(cookies: httpx.Cookies, user_agent: str) -> httpx.AsyncClient:
     """
-    Main scraping function for BidNet Direct Santa Clarita.
+    Build the pooled HTTP/2 client used for detail page fetches.
     
     Args:
-        date_filter: Date filter in MM/DD/YYYY format
+        cookies: Session cookies copied from the logged-in browser
+        user_agent: Browser user agent, so the requests match the login session
         
     Returns:
-        Tuple[pd.DataFrame, Dict]: Scraped data and statistics
+        httpx.AsyncClient: Client to be used as an async context manager
     """
-    print("\n" + "="*60)
-    print("BIDNET DIRECT SCRAPER - SANTA CLARITA")
-    print("="*60)
+    limits = httpx.Limits(max_connections=DETAIL_CONCURRENCY * 2, max_keepalive_connections=DETAIL_CONCURRENCY * 2,
+                          keepalive_expiry=KEEPALIVE_EXPIRY)
+    return httpx.AsyncClient(http2=True, limits=limits, timeout=DETAIL_TIMEOUT, cookies=cookies,
+                             headers={'User-Agent': user_agent}, follow_redirects=True)
+
+def _detail_cache_key(detail_url: str, closing_date: str, with_date: bool) -> str:
+    """
+    Build the detail cache key for a bid page.
     
-    # Initialize stats tracking
-    scraping_stats = {
-        'successful_sites': [],
-        'skipped_sites': [],
-        'failed_pages': [],
-        'total_bids': 0,
-        'total_sites_attempted': 1,
-        'total_sites_successful': 0,
-        'total_pages_attempted': 0,
-        'total_pages_failed': 0
-    }
+    The listing's closing date is part of the key, so a bid whose deadline
+    is revised (usually alongside an addendum) is fetched again. So is
+    with_date, so a parse that skipped the publication date is never
+    served to a bid that needs it.
     
-    all_items = []
+    Args:
+        detail_url: URL of the individual bid page
+        closing_date: Closing date shown on the listing row
+        with_date: Whether the publication date was looked up
+        
+    Returns:
+        str: SHA-1 hex digest of the URL, closing date and with_date
+    """
+    return hashlib.sha1(f"{detail_url}|{closing_date}|{with_date:d}".encode()).hexdigest()
+
+def _session_cookies(driver) -> httpx.Cookies:
+    """
+    Copy the logged-in browser's cookies into an httpx cookie jar.
     
-    # Create browser instance
-    driver = uc.Chrome()
+    All cookies are read over CDP, since driver.get_cookies() only returns
+    those for the current page and pooled browsers are parked on about:blank.
     
-    try:
-        # Step 1: Login to BidNet Direct
-        login_success = login_to_bidnet(driver)
-        if not login_success:
-            print("❌ Login failed, aborting scrape")
-            return pd.DataFrame(), scraping_stats
+    Args:
+        driver: Selenium WebDriver instance after login
         
-        # Step 2: Navigate to Santa Clarita bid listing
-        print(f"\n🌐 Navigating to Santa Clarita bid listing...")
-        driver.get(SANTA_CLARITA_URL)
+    Returns:
+        httpx.Cookies: Cookies scoped to their original domains and paths
+    """
+    cookies = httpx.Cookies()
+    for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']:
+        cookies.set(cookie['name'], cookie['value'],
+                    domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+    return cookies
+
+async def scrape_all_stream(scraping_stats: Dict, date_filter: str = None) -> AsyncIterator[Dict]:
+    """
+    Scrape BidNet Direct Santa Clarita, yielding each bid as soon as it is complete.
+    
+    Bids are yielded in listing order. A bid is yielded once its own detail
+    page has been parsed, while later pages are still being fetched, so
+    consumers (CSV writes, Airtable pushes) can overlap with the scrape. Each
+    bid is also written to OUTPUT_CSV as it is yielded.
+    
+    Args:
+        scraping_stats: Statistics dict (see scrape_all) updated in place
+        date_filter: Date filter in MM/DD/YYYY format
+        
+    Yields:
+        Dict: One bid record with summary, detail and Airtable fields
         
-        # Wait for page to load
-        time.sleep(5)
+    Example:
+        >>> async for item in scrape_all_stream(stats, date_filter="11/01/2025"):
+        ...     push_to_airtable(item)
+    """
+    log.info("BIDNET DIRECT SCRAPER - SANTA CLARITA")
+    
+    bids_found = 0
+    
+    # Step 1: Get a logged-in browser (warm from the pool when available)
+    driver = acquire_driver()
+    if driver is None:
+        log.error("❌ Login failed, aborting scrape")
+        return
+    
+    try:
+        # Step 2: Fetch the Santa Clarita bid listing over HTTP with the
+        # browser's session cookies
+        cookies = _session_cookies(driver)
+        user_agent = driver.execute_script("return navigator.userAgent")
+        summary_items = fetch_summary_data(cookies, user_agent, date_filter)
         
-        # Step 3: Extract summary data from listing page
-        summary_items = extract_summary_data(driver, date_filter)
+        # Step 3: Fall back to extracting the listing in the browser
+        if summary_items is None:
+            log.info("🌐 Navigating to Santa Clarita bid listing...")
+            driver.get(SANTA_CLARITA_URL)
+            
+            # A pooled browser's session may have expired since its last run
+            if "login" in driver.current_url.lower():
+                log.info("🔐 Session expired, logging in again...")
+                if not login_to_bidnet(driver):
+                    log.error("❌ Login failed, aborting scrape")
+                    return
+                driver.get(SANTA_CLARITA_URL)
+                cookies = _session_cookies(driver)
+            
+            # Wait for page to load
+            time.sleep(5)
+            
+            summary_items = extract_summary_data(driver, date_filter)
         
         if not summary_items:
-            print("⚠️  No summary items found")
+            log.warning("⚠️  No summary items found")
             scraping_stats['skipped_sites'].append({
                 'portal_code': 'santa_clarita',
                 'url': SANTA_CLARITA_URL,
                 'reason': 'No bids found'
             })
-            return pd.DataFrame(), scraping_stats
+            return
         
         scraping_stats['total_pages_attempted'] = len(summary_items)
         
-        # Step 4: Scrape detailed descriptions from individual pages
-        print(f"\n📖 Scraping detailed descriptions for {len(summary_items)} bids...")
-        
-        for i, item in enumerate(summary_items):
-            detail_url = item.get('detail_url')
-            if detail_url:
+        # Step 4: Scrape detailed descriptions from individual pages. Only the
+        # login and listing need the browser; detail pages are fetched
+        # concurrently over HTTP with the browser's session cookies.
+        log.info("📖 Scraping detailed descriptions for %d bids...", len(summary_items))
+        # Each distinct page is fetched once per run, and not at all while its
+        # cached parse (key -> (timestamp, (description, published_date))) is fresh.
+        # The publication date is only looked up for pages whose listing row
+        # has none (url -> (closing_date, with_date)).
+        pages = {}
+        for item in summary_items:
+            url = item.get('detail_url')
+            if url:
+                closing_date, with_date = pages.get(url, (item['closing_date'], False))
+                pages[url] = (closing_date, with_date or not item['published_date'])
+        cache_keys = {url: _detail_cache_key(url, closing_date, with_date)
+                      for url, (closing_date, with_date) in pages.items()}
+        fetched_details = {}
+        os.makedirs(os.path.dirname(DETAIL_CACHE_PATH), exist_ok=True)
+        os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
+        with shelve.open(DETAIL_CACHE_PATH) as cache, \
+                open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as csv_file:
+            now = time.time()
+            for url, key in cache_keys.items():
+                cached = cache.get(key)
+                if cached and now - cached[0] < DETAIL_CACHE_TTL:
+                    fetched_details[url] = cached[1]
+            pending = {url: pages[url][1] for url in cache_keys if url not in fetched_details}
+            
+            # Rows are written to the CSV as each bid completes, so an
+            # interrupted run still leaves the finished bids on disk
+            log.info("💾 Streaming BidNet data to %s...", OUTPUT_CSV)
+            writer = csv.DictWriter(csv_file, fieldnames=AIRTABLE_CSV_HEADERS, restval="", extrasaction="ignore")
+            writer.writeheader()
+            
+            log.info("🌐 Fetching %d detail pages (%d cached, concurrency: %d)...",
+                     len(pending), len(fetched_details), DETAIL_CONCURRENCY)
+            async with _detail_client(cookies, user_agent) as client:
+                fetches = _start_detail_fetches(client, pending)
                 try:
-                    # Scrape description and published date from detail page
-                    description, published_date_detail = scrape_bid_description_and_dates(driver, detail_url)
-                    item['summary'] = description
-
-                    # Add Airtable-compatible field mappings
-                    item['Project Title'] = item['project_title']
-                    item['Summary'] = description
-                    # Prefer summary published_date, else use detail page
-                    item['Published Date'] = item['published_date'] if item['published_date'] else (published_date_detail or "")
-                    item['Due Date'] = item['closing_date']
-                    item['Link'] = detail_url
-
-                    # Add metadata
-                    item['portal_code'] = 'bidnet_santa_clarita'
-                    item['city_name'] = 'Santa Clarita'
-
-                    all_items.append(item)
-
-                except Exception as e:
-                    print(f"    ❌ Failed to scrape detail for {item.get('solicitation_number')}: {e}")
-                    scraping_stats['failed_pages'].append({
-                        'portal_code': 'santa_clarita',
-                        'solicitation_number': item.get('solicitation_number'),
-                        'detail_url': detail_url,
-                        'reason': f'Detail scraping failed: {str(e)[:100]}...'
-                    })
-                    scraping_stats['total_pages_failed'] += 1
-                    # Add item without description as fallback
-                    item['summary'] = ""
-                    item['Project Title'] = item['project_title']
-                    item['Summary'] = ""
-                    item['Published Date'] = item['published_date']
-                    item['Due Date'] = item['closing_date']
-                    item['Link'] = detail_url
-                    item['portal_code'] = 'bidnet_santa_clarita'
-                    item['city_name'] = 'Santa Clarita'
-                    all_items.append(item)
-            else:
-                print(f"    ⚠️  No detail URL for {item.get('solicitation_number')}")
-                # Add item without detail URL
-                item['summary'] = ""
-                item['Project Title'] = item['project_title']
-                item['Summary'] = ""
-                item['Published Date'] = item['published_date']
-                item['Due Date'] = item['closing_date']
-                item['Link'] = ""
-                item['portal_code'] = 'bidnet_santa_clarita'
-                item['city_name'] = 'Santa Clarita'
-                all_items.append(item)
+                    for i, item in enumerate(summary_items):
+                        detail_url = item.get('detail_url')
+                        if detail_url:
+                            try:
+                                # Wait for this bid's own page only; later pages keep downloading
+                                if detail_url not in fetched_details:
+                                    try:
+                                        fetched_details[detail_url] = await fetches[detail_url]
+                                        # Only cache complete parses, so a blank page is fetched again next run
+                                        description, published_date_detail = fetched_details[detail_url]
+                                        if description and (published_date_detail or not pages[detail_url][1]):
+                                            cache[cache_keys[detail_url]] = (time.time(), fetched_details[detail_url])
+                                    except Exception as e:
+                                        fetched_details[detail_url] = e
+                                
+                                # Use the HTTP result, falling back to the browser if the fetch failed
+                                detail = fetched_details[detail_url]
+                                if isinstance(detail, BaseException):
+                                    log.warning("⚠️  HTTP fetch failed (%s), retrying in browser", detail)
+                                    # Load the page off the event loop so the other detail
+                                    # fetches keep downloading; only this call uses the driver
+                                    detail = await asyncio.to_thread(
+                                        scrape_bid_description_and_dates, driver, detail_url, pages[detail_url][1]
+                                    )
+                                description, published_date_detail = detail
+                                item['summary'] = description
+
+                                # Add Airtable-compatible field mappings
+                                item['Project Title'] = item['project_title']
+                                item['Summary'] = description
+                                # Prefer summary published_date, else use detail page
+                                item['Published Date'] = item['published_date'] if item['published_date'] else (published_date_detail or "")
+                                item['Due Date'] = item['closing_date']
+                                item['Link'] = detail_url
+
+                                # Add metadata
+                                item['portal_code'] = 'bidnet_santa_clarita'
+                                item['city_name'] = 'Santa Clarita'
+
+                            except Exception as e:
+                                log.error("❌ Failed to scrape detail for %s: %s", item.get('solicitation_number'), e)
+                                scraping_stats['failed_pages'].append({
+                                    'portal_code': 'santa_clarita',
+                                    'solicitation_number': item.get('solicitation_number'),
+                                    'detail_url': detail_url,
+                                    'reason': f'Detail scraping failed: {str(e)[:100]}...'
+                                })
+                                scraping_stats['total_pages_failed'] += 1
+                                # Add item without description as fallback
+                                item['summary'] = ""
+                                item['Project Title'] = item['project_title']
+                                item['Summary'] = ""
+                                item['Published Date'] = item['published_date']
+                                item['Due Date'] = item['closing_date']
+                                item['Link'] = detail_url
+                                item['portal_code'] = 'bidnet_santa_clarita'
+                                item['city_name'] = 'Santa Clarita'
+                        else:
+                            log.warning("⚠️  No detail URL for %s", item.get('solicitation_number'))
+                            # Add item without detail URL
+                            item['summary'] = ""
+                            item['Project Title'] = item['project_title']
+                            item['Summary'] = ""
+                            item['Published Date'] = item['published_date']
+                            item['Due Date'] = item['closing_date']
+                            item['Link'] = ""
+                            item['portal_code'] = 'bidnet_santa_clarita'
+                            item['city_name'] = 'Santa Clarita'
+                        
+                        writer.writerow(item)
+                        bids_found += 1
+                        yield item
+                finally:
+                    # Stop fetches nobody will read (consumer stopped early or a critical error)
+                    for fetch in fetches.values():
+                        fetch.cancel()
         
         # Update statistics
-        if all_items:
+        if bids_found:
             scraping_stats['successful_sites'].append({
                 'portal_code': 'santa_clarita',
                 'url': SANTA_CLARITA_URL,
-                'bids_found': len(all_items)
+                'bids_found': bids_found
             })
             scraping_stats['total_sites_successful'] = 1
-            scraping_stats['total_bids'] = len(all_items)
+            scraping_stats['total_bids'] = bids_found
             
-            print(f"✅ Successfully scraped {len(all_items)} items from Santa Clarita")
+            log.info("✅ Successfully scraped %d items from Santa Clarita", bids_found)
         
     except Exception as e:
-        print(f"❌ Critical error during scraping: {e}")
+        log.error("❌ Critical error during scraping: %s", e)
         scraping_stats['skipped_sites'].append({
             'portal_code': 'santa_clarita',
             'url': SANTA_CLARITA_URL,
@@ -578,27 +1008,50 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
         })
         
     finally:
-        driver.quit()
-        print("🔒 Browser session closed")
+        release_driver(driver)
+        log.info("🔒 Browser session returned to pool")
     
     # Save failed URLs if any
     if scraping_stats.get('failed_pages'):
         save_failed_pages_batch(scraping_stats['failed_pages'], 'BidNet Direct')
+
+def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Main scraping function for BidNet Direct Santa Clarita.
     
-    # Create DataFrame and save CSV
-    if all_items:
-        # Create output directory if it doesn't exist
-        os.makedirs("bidnet", exist_ok=True)
+    Collects every bid from scrape_all_stream() into a DataFrame.
+    
+    Args:
+        date_filter: Date filter in MM/DD/YYYY format
         
-        # Save raw data CSV
-        print(f"\n💾 Saving BidNet data to CSV...")
-        save_airtable_format_csv(all_items, OUTPUT_CSV, "BidNet Direct")
-        print(f"✅ BidNet data saved to: {OUTPUT_CSV}")
+    Returns:
+        Tuple[pd.DataFrame, Dict]: Scraped data and statistics
+    """
+    # Initialize stats tracking
+    scraping_stats = {
+        'successful_sites': [],
+        'skipped_sites': [],
+        'failed_pages': [],
+        'total_bids': 0,
+        'total_sites_attempted': 1,
+        'total_sites_successful': 0,
+        'total_pages_attempted': 0,
+        'total_pages_failed': 0
+    }
+    
+    async def collect() -> List[Dict]:
+        return [item async for item in scrape_all_stream(scraping_stats, date_filter)]
+    
+    all_items = asyncio.run(collect())
+    
+    # Create DataFrame (the CSV was written as the bids were scraped)
+    if all_items:
+        log.info("✅ BidNet data saved to: %s", OUTPUT_CSV)
         
         df = pd.DataFrame(all_items)
         return df, scraping_stats
     else:
-        print("⚠️  No BidNet data to save to CSV")
+        log.warning("⚠️  No BidNet data to save to CSV")
         return pd.DataFrame(), scraping_stats
 
 # =============================================================================
@@ -609,6 +1062,12 @@ def main() -> None:
     """
     Main execution function for BidNet Direct scraper.
     """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] [%(levelname)s] %(message)s',
+        datefmt='%H:%M:%S'
+    )
+    
     print("\n" + "="*60)
     print("BIDNET DIRECT SCRAPER - SANTA CLARITA")
     print("="*60)
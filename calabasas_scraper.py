@@ -11,9 +11,9 @@ Created: 2025-11-08
 Updated: 2025-11-09
 """
 
+import csv
 import os
 import re
-import time
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -30,7 +30,9 @@ from urllib.parse import urljoin
 # Local imports
 from utils import (
     get_chromedriver_path,
+    load_cached_listing,
     parse_mmddyyyy,
+    save_cached_listing,
     save_failed_pages_batch,
     save_airtable_format_csv
 )
@@ -42,11 +44,36 @@ from utils import (
 
 BASE_URL = "https://www.cityofcalabasas.com/services/public-notices"
 OUTPUT_CSV = "calabasas/calabasas_bids.csv"
+LIST_CACHE_PATH = "calabasas/.list_cache.json"  # RFPs and HTTP validators of the last run
+LIST_CACHE_VARIANT = "raw-due-dates"  # Cached records carry due_date_text for re-parsing
 
 # Retry Configuration
 MAX_RETRIES = 3
 RETRY_DELAY = 3  # seconds
 
+# Due date cleanup patterns (see parse_calabasas_date)
+_DAY_RE = re.compile(r'^[A-Za-z]+,\s*')
+_AT_RE = re.compile(r'\s+at\s+.*$')
+_ONBEFORE_RE = re.compile(r',\s+on\s+or\s+before.*$')
+_YEAR_RE = re.compile(r'\d{4}')
+
+# CSS selector for the RFP list items (soupsieve caches the compiled form)
+_RFP_ITEMS_SEL = '#RequestforProposalsRFP div.accordion-content li'
+
+# RFP accordion scripts, each run in a single WebDriver round trip.
+# Opening returns [was_open, is_open]; a missing heading raises a JavascriptException.
+_OPEN_RFP_ACCORDION_JS = """
+const el = document.getElementById('RequestforProposalsRFP');
+const wasOpen = el.classList.contains('state-open');
+if (!wasOpen) {
+    el.querySelector('.accordion-heading').click();
+}
+return [wasOpen, el.classList.contains('state-open')];
+"""
+_RFP_ACCORDION_IS_OPEN_JS = (
+    "return document.getElementById('RequestforProposalsRFP').classList.contains('state-open');"
+)
+
 
 def extract_rfp_listings(driver) -> List[Dict]:
     """
@@ -59,22 +86,13 @@ def extract_rfp_listings(driver) -> List[Dict]:
     rfps = []
     
     try:
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = BeautifulSoup(driver.page_source, 'lxml')
         
-        # Find the RFP accordion section
-        rfp_section = soup.find('div', id='RequestforProposalsRFP')
-        if not rfp_section:
-            print("  ⚠️  RFP section not found")
-            return rfps
-            
-        # Find the content area within the accordion
-        content_area = rfp_section.find('div', class_='accordion-content')
-        if not content_area:
-            print("  ⚠️  RFP content area not found")
+        # Find all list items with RFPs in the accordion's content area
+        rfp_items = soup.select(_RFP_ITEMS_SEL)
+        if not rfp_items:
+            print("  ⚠️  RFP section or content area not found")
             return rfps
-        
-        # Find all list items with RFPs
-        rfp_items = content_area.find_all('li')
         print(f"  📋 Found {len(rfp_items)} total items")
         
         current_rfp = None  # Track the current RFP for addendums
@@ -82,7 +100,7 @@ def extract_rfp_listings(driver) -> List[Dict]:
         for i, item in enumerate(rfp_items, 1):
             try:
                 # Extract project name from the <a> tag (always use this for both title and summary)
-                link_elem = item.find('a')
+                link_elem = item.select_one('a')
                 if not link_elem:
                     print(f"    ❌ Item {i}: No link found")
                     continue
@@ -93,10 +111,10 @@ def extract_rfp_listings(driver) -> List[Dict]:
                 # Extract due date from the first <strong> tag (at the start of the <li>)
                 # This is robust even if there are nested <strong> tags
                 due_date_text = ""
-                strongs = item.find_all('strong')
-                if strongs:
+                first_strong = item.select_one('strong')
+                if first_strong:
                     # Use the first <strong> tag's text
-                    due_date_text = strongs[0].get_text(strip=True)
+                    due_date_text = first_strong.get_text(strip=True)
                     # Remove trailing dash and whitespace
                     due_date_text = due_date_text.rstrip(' -')
 
@@ -141,6 +159,39 @@ def extract_rfp_listings(driver) -> List[Dict]:
         return rfps
 
 
+def parse_calabasas_dates(date_texts: List[str]) -> List[str]:
+    """
+    Parse Calabasas due dates to MM/DD/YYYY in one vectorized pandas pass.
+    
+    Day names, times and "on or before" suffixes are stripped, and the
+    current year is assumed when none is given.
+    
+    Args:
+        date_texts: Date strings like "Monday, November 17, 2025 at 2:00 p.m."
+        
+    Returns:
+        List[str]: Dates in MM/DD/YYYY format, in input order ('' if unparseable)
+    """
+    if not date_texts:
+        return []
+    
+    texts = pd.Series(date_texts, dtype=object)
+    clean_text = (
+        texts.str.replace(_DAY_RE, '', regex=True)
+        .str.replace(_AT_RE, '', regex=True)
+        .str.replace(_ONBEFORE_RE, '', regex=True)
+        .str.strip()
+    )
+    # If no year found, assume current year
+    clean_text = clean_text.where(clean_text.str.contains(_YEAR_RE), clean_text + f', {datetime.now().year}')
+    parsed = pd.to_datetime(clean_text, format='%B %d, %Y', errors='coerce')
+    
+    for date_text in texts[parsed.isna() & (texts != '')]:
+        print(f"    ⚠️  Could not parse date '{date_text}'")
+    
+    return parsed.dt.strftime('%m/%d/%Y').fillna('').tolist()
+
+
 def parse_calabasas_date(date_text: str) -> str:
     """
     Parse Calabasas date format to MM/DD/YYYY.
@@ -151,39 +202,15 @@ def parse_calabasas_date(date_text: str) -> str:
     Returns:
         str: Date in MM/DD/YYYY format
     """
-    if not date_text:
-        return ''
-    
-    try:
-        # Remove day of week and time
-        clean_text = date_text
-        
-        # Remove day of week (e.g., "Monday, ")
-        clean_text = re.sub(r'^[A-Za-z]+,\s*', '', clean_text)
-        
-        # Remove time portion and extra text
-        clean_text = re.sub(r'\s+at\s+.*$', '', clean_text)
-        clean_text = re.sub(r',\s+on\s+or\s+before.*$', '', clean_text)
-        
-        # Handle cases where year is missing (add current year)
-        clean_text = clean_text.strip()
-        if not re.search(r'\d{4}', clean_text):
-            # If no year found, assume current year
-            clean_text += f', {datetime.now().year}'
-        
-        # Parse the date
-        parsed_date = datetime.strptime(clean_text.strip(), '%B %d, %Y')
-        return parsed_date.strftime('%m/%d/%Y')
-        
-    except Exception as e:
-        print(f"    ⚠️  Could not parse date '{date_text}': {e}")
-        return ''
+    return parse_calabasas_dates([date_text])[0] if date_text else ''
 
 
 def scrape_calabasas(cutoff_date: datetime, headless: bool = True) -> Tuple[List[Dict], List[str]]:
     """
     Scrape all RFP opportunities from Calabasas portal.
     
+    A failed headless attempt is retried once with a visible browser.
+    
     Args:
         cutoff_date: Only include RFPs published after this date
         headless: Whether to run Chrome in headless mode
@@ -193,6 +220,28 @@ def scrape_calabasas(cutoff_date: datetime, headless: bool = True) -> Tuple[List
     """
     print("🚀 Starting Calabasas RFP scraping...")
     
+    all_rfps, failed_urls = [], []
+    for attempt, attempt_headless in enumerate((True, False) if headless else (False,)):
+        if attempt:
+            print("🔄 Retrying without headless mode...")
+        all_rfps, failed_urls, success = _scrape_calabasas_attempt(attempt_headless)
+        if success:
+            break
+    
+    return all_rfps, failed_urls
+
+
+def _scrape_calabasas_attempt(headless: bool) -> Tuple[List[Dict], List[str], bool]:
+    """
+    Run one Calabasas scraping attempt in a new Chrome session.
+    
+    Args:
+        headless: Whether to run Chrome in headless mode
+        
+    Returns:
+        Tuple[List[Dict], List[str], bool]: (rfp_data, failed_urls, success);
+        success is False if the attempt failed in a way a visible browser may fix
+    """
     driver = None
     failed_urls = []
     all_rfps = []
@@ -205,6 +254,11 @@ def scrape_calabasas(cutoff_date: datetime, headless: bool = True) -> Tuple[List
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
+        # Only the page HTML is read, so skip downloading images
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        # Return from driver.get() at DOMContentLoaded; the RFP section is waited for explicitly
+        chrome_options.page_load_strategy = 'eager'
         
         if headless:
             chrome_options.add_argument('--headless')
@@ -221,10 +275,6 @@ def scrape_calabasas(cutoff_date: datetime, headless: bool = True) -> Tuple[List
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
         
-        # Extra wait for dynamic content to load
-        wait_time = 10 if headless else 5
-        time.sleep(wait_time)
-        
         print("🔄 Waiting for page to fully load...")
         
         # Try to find and interact with the accordion
@@ -238,21 +288,19 @@ def scrape_calabasas(cutoff_date: datetime, headless: bool = True) -> Tuple[List
             print("✅ RFP section found")
             accordion_found = True
             
-            rfp_accordion = driver.find_element(By.ID, "RequestforProposalsRFP")
-            if "state-open" not in rfp_accordion.get_attribute("class"):
+            was_open, is_open = driver.execute_script(_OPEN_RFP_ACCORDION_JS)
+            if not was_open:
                 print("🔄 Opening RFP accordion...")
-                accordion_header = rfp_accordion.find_element(By.CLASS_NAME, "accordion-heading")
-                driver.execute_script("arguments[0].click();", accordion_header)
-                time.sleep(5)  # Wait for accordion to expand
+                if not is_open:
+                    # Wait for accordion to expand
+                    WebDriverWait(driver, 10).until(lambda d: d.execute_script(_RFP_ACCORDION_IS_OPEN_JS))
             else:
                 print("✅ RFP accordion already open")
                 
         except Exception as e:
             print(f"⚠️  Could not interact with accordion: {e}")
             if headless:
-                print("🔄 Retrying without headless mode...")
-                driver.quit()
-                return scrape_calabasas(cutoff_date, headless=False)
+                return all_rfps, failed_urls, False
         
         print("⏳ Extracting RFP listings...")
         
@@ -261,21 +309,18 @@ def scrape_calabasas(cutoff_date: datetime, headless: bool = True) -> Tuple[List
         
         if not summary_rfps:
             print("❌ No RFPs found on main page")
-            if headless and accordion_found:
-                print("🔄 Retrying without headless mode...")
-                driver.quit()
-                return scrape_calabasas(cutoff_date, headless=False)
-            return all_rfps, failed_urls
+            return all_rfps, failed_urls, not (headless and accordion_found)
         
         print(f"📊 Processing {len(summary_rfps)} RFPs...")
         
+        # Parse all due dates from main page at once
+        due_dates = parse_calabasas_dates([rfp.get('due_date_text', '') for rfp in summary_rfps])
+        
         # Process each RFP - simplified without PDF extraction
-        for i, rfp in enumerate(summary_rfps, 1):
+        for i, (rfp, due_date) in enumerate(zip(summary_rfps, due_dates), 1):
             print(f"\n🔍 Processing RFP {i}/{len(summary_rfps)}: {rfp.get('project_title', 'Unknown')[:60]}...")
             
             try:
-                # Parse due date from main page
-                due_date = parse_calabasas_date(rfp.get('due_date_text', ''))
                 pdf_url = rfp.get('detail_url', '')
                 title = rfp.get('project_title', '')
                 
@@ -287,7 +332,8 @@ def scrape_calabasas(cutoff_date: datetime, headless: bool = True) -> Tuple[List
                     'scope_of_services': title,  # Use title as summary
                     'bid_url': pdf_url,
                     'source': 'Calabasas',
-                    'scraped_at': datetime.now().isoformat()
+                    'scraped_at': datetime.now().isoformat(),
+                    'due_date_text': rfp.get('due_date_text', '')  # Kept for the listing cache
                 }
                 
                 # Always include the RFP since we're not filtering by published date
@@ -302,23 +348,18 @@ def scrape_calabasas(cutoff_date: datetime, headless: bool = True) -> Tuple[List
         print(f"   📊 Total RFPs found: {len(summary_rfps)}")
         print(f"   ✅ RFPs added to results: {len(all_rfps)}")
         
-        return all_rfps, failed_urls
+        return all_rfps, failed_urls, True
         
     except Exception as e:
         print(f"❌ Calabasas scraping failed: {e}")
-        if headless:
-            print("🔄 Retrying without headless mode...")
-            if driver:
-                driver.quit()
-            return scrape_calabasas(cutoff_date, headless=False)
-        return all_rfps, failed_urls
+        return all_rfps, failed_urls, False
         
     finally:
         if driver:
             driver.quit()
 
 
-def print_portal_summary(count, portal_name, error=None):
+def print_portal_summary(count, portal_name, error=None, cached=False):
     """
     Print a summary of the scraping result for the portal.
     
@@ -326,9 +367,12 @@ def print_portal_summary(count, portal_name, error=None):
         count: Number of RFPs scraped
         portal_name: Name of the portal (for logging)
         error: Optional error message if scraping failed
+        cached: Whether the RFPs were reused from the last run (portal unchanged)
     """
     if error:
         print(f"❌  [{portal_name}] Failed to scrape ({error})\n")
+    elif count > 0 and cached:
+        print(f"✅  [{portal_name}] {count} RFPs reused (portal unchanged since last run)\n")
     elif count > 0:
         print(f"✅  [{portal_name}] {count} RFPs scraped\n")
     else:
@@ -357,8 +401,23 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
         cutoff_date = datetime(2020, 1, 1)  # Very old date to include all
         print("📅 No date filter applied (including all RFPs)")
     
-    # Scrape data
-    rfp_data, failed_urls = scrape_calabasas(cutoff_date)
+    # Skip the browser entirely if the portal is unchanged since the last run
+    cached_rfps, validators = load_cached_listing(BASE_URL, LIST_CACHE_PATH, LIST_CACHE_VARIANT)
+    if cached_rfps is not None:
+        # Re-parse the due dates so a missing year is assumed for this run
+        due_dates = parse_calabasas_dates([rfp['due_date_text'] for rfp in cached_rfps])
+        scraped_at = datetime.now().isoformat()
+        rfp_data = [
+            {**rfp, 'bid_due_date': due_date, 'scraped_at': scraped_at}
+            for rfp, due_date in zip(cached_rfps, due_dates)
+        ]
+        failed_urls = []
+    else:
+        rfp_data, failed_urls = scrape_calabasas(cutoff_date)
+        if rfp_data and not failed_urls:
+            save_cached_listing(LIST_CACHE_PATH, BASE_URL, validators, rfp_data, LIST_CACHE_VARIANT)
+    for rfp in rfp_data:
+        rfp.pop('due_date_text', None)
     
     # Convert to DataFrame
     if rfp_data:
@@ -380,32 +439,34 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
         'source': 'Calabasas'
     }
     
-    # Save to CSV
-    if not df.empty:
+    # Save to CSV straight from the records (same layout as df.to_csv)
+    if rfp_data:
         os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
-        df.to_csv(OUTPUT_CSV, index=False)
+        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rfp_data[0].keys()), lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rfp_data)
         print(f"💾 Saved to: {OUTPUT_CSV}")
         
         # Save in Airtable format
         airtable_csv = OUTPUT_CSV.replace('.csv', '_airtable.csv')
         
-        # Convert DataFrame to Airtable format
-        airtable_data = []
-        for _, row in df.iterrows():
-            airtable_record = {
-                "Project Name": row['bid_title'],
-                "Summary": row['scope_of_services'],
-                "Published Date": row['bid_posting_date'],
-                "Due Date": row['bid_due_date'],
-                "Link": row['bid_url'],
-                "Date Scraped": datetime.now().strftime('%Y-%m-%d')
+        # Convert records to Airtable format
+        airtable_data = [
+            {
+                "Project Name": rfp['bid_title'],
+                "Summary": rfp['scope_of_services'],
+                "Published Date": rfp['bid_posting_date'],
+                "Due Date": rfp['bid_due_date'],
+                "Link": rfp['bid_url']
             }
-            airtable_data.append(airtable_record)
+            for rfp in rfp_data
+        ]
         
         save_airtable_format_csv(airtable_data, airtable_csv, 'Calabasas')
         print(f"💾 Airtable format saved to: {airtable_csv}")
     
-    print_portal_summary(len(df), 'Calabasas')
+    print_portal_summary(len(df), 'Calabasas', cached=cached_rfps is not None)
     
     return df, stats
 
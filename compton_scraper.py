@@ -10,130 +10,294 @@ Usage:
     python compton_scraper.py
 """
 
+import asyncio
 import os
 import time
 import re
+import httpx
+import lxml.html
 import pandas as pd
-from datetime import datetime
 from bs4 import BeautifulSoup
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
+from utils import get_chromedriver_path, load_cached_listing, save_cached_listing
+
 BASE_URL = "https://www.comptoncity.org"
 LIST_URL = f"{BASE_URL}/departments/city-clerk/rfps-and-bids"
 OUTPUT_CSV = "compton/compton_bids.csv"
+LIST_CACHE_PATH = "compton/.list_cache.json"  # Bids and HTTP validators of the last run
 SELENIUM_TIMEOUT = 20
+BROWSER_MIN_INTERVAL = 0.5  # Minimum seconds between browser detail page loads
+
+# Trailing time / comma suffixes stripped by normalize_date
+_TIME_RE = re.compile(r'\s+\d{1,2}:\d{2}\s*(AM|PM).*$', re.IGNORECASE)
+_COMMA_RE = re.compile(r',.*$')
+
+# Detail Page HTTP Configuration
+DETAIL_CONCURRENCY = 20  # Maximum simultaneous detail page requests
+DETAIL_TIMEOUT = SELENIUM_TIMEOUT
+HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    )
+}
+
+# Detail pages are read straight from lxml: the summary is the visible text of
+# the first detail-content div (script/style text and comments excluded).
+# Pages are fed to a pull parser in chunks so parsing stops once the div closes.
+DETAIL_PARSE_CHUNK = 16384  # characters
+_DETAIL_PARSER = lxml.html.HTMLParser(remove_comments=True, collect_ids=False)
+_DETAIL_CONTENT_XPATH = etree.XPath(
+    "(//div[contains(concat(' ', normalize-space(@class), ' '), ' detail-content ')])[1]"
+)
+_VISIBLE_TEXT_XPATH = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
 
 def normalize_date(date_string):
     if not date_string:
         return ""
-    date_str = str(date_string).strip()
-    date_str = re.sub(r'\s+\d{1,2}:\d{2}\s*(AM|PM).*$', '', date_str, flags=re.IGNORECASE)
-    date_str = re.sub(r',.*$', '', date_str)
-    # Try MM/DD/YYYY
-    try:
-        dt = datetime.strptime(date_str, '%m/%d/%Y')
-        return dt.strftime('%Y-%m-%d')
-    except:
-        pass
+    return normalize_dates([str(date_string)])[0]
+
+def normalize_dates(date_strings):
+    """
+    Vectorized normalize_date(): convert MM/DD/YYYY dates to YYYY-MM-DD in one pandas pass.
+
+    Args:
+        date_strings (List[str]): Date cell texts, optionally with a trailing
+            time or comma-separated suffix
+
+    Returns:
+        List[str]: Normalized dates in input order; values that are not
+        MM/DD/YYYY dates are returned unchanged
+    """
+    if not date_strings:
+        return []
+    raw = pd.Series(date_strings, dtype=object)
+    # Try MM/DD/YYYY after dropping any time / comma suffix
+    cleaned = raw.str.strip().str.replace(_TIME_RE, '', regex=True).str.replace(_COMMA_RE, '', regex=True)
+    parsed = pd.to_datetime(cleaned, format='%m/%d/%Y', errors='coerce')
     # Try MM/DD/YYYY H:MM AM/PM
-    try:
-        dt = datetime.strptime(date_string, '%m/%d/%Y %I:%M %p')
-        return dt.strftime('%Y-%m-%d')
-    except:
-        pass
-    return date_string
+    parsed = parsed.fillna(pd.to_datetime(raw, format='%m/%d/%Y %I:%M %p', errors='coerce'))
+    return parsed.dt.strftime('%Y-%m-%d').where(parsed.notna(), raw).tolist()
 
-def scrape_compton_bids():
-    print(f"🌐 Fetching: {LIST_URL} (Selenium)")
-    chrome_options = Options()
-    # chrome_options.add_argument('--headless')  # DISABLED for debugging, run with browser visible
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+def parse_list_rows(rows):
+    """
+    Read the bids from the list table rows, normalizing all dates at once.
+
+    Args:
+        rows (List[Tag]): <tr> elements of the list table body; rows with
+            fewer than three cells are skipped
+
+    Returns:
+        List[Tuple[str, str, str, str]]: (project_title, detail_url,
+        published_date, due_date) per bid
+    """
     bids = []
+    for row in rows:
+        cols = row.find_all('td')
+        if len(cols) < 3:
+            continue
+        title_cell = cols[0]
+        title_a = title_cell.find('a')
+        project_title = title_a.get_text(strip=True) if title_a else title_cell.get_text(strip=True)
+        detail_url = BASE_URL + title_a['href'] if title_a and title_a.has_attr('href') else LIST_URL
+        bids.append((project_title, detail_url, cols[1].get_text(strip=True), cols[2].get_text(strip=True)))
+    published_dates = normalize_dates([bid[2] for bid in bids])
+    due_dates = normalize_dates([bid[3] for bid in bids])
+    return [
+        (project_title, detail_url, published_date, due_date)
+        for (project_title, detail_url, _, _), published_date, due_date in zip(bids, published_dates, due_dates)
+    ]
+
+def parse_detail_summary(html):
+    """
+    Extract the summary text from a Compton bid detail page.
+
+    Matches BeautifulSoup's ``find('div', class_='detail-content').get_text("\\n", strip=True)``.
+
+    Args:
+        html: Detail page source
+
+    Returns:
+        Optional[str]: Newline-separated text of the detail-content block, or
+        None if the page has no such block
+    """
     try:
-        driver.get(LIST_URL)
-        WebDriverWait(driver, SELENIUM_TIMEOUT * 2).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "table.listtable tbody tr"))
-        )
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        table = soup.find('table', class_='listtable')
-        if not table:
-            print("❌ Could not find bids table!")
-            return
-        rows = table.find('tbody').find_all('tr')
-        print(f"📊 Found {len(rows)} bid rows in table")
-        for row in rows:
-            cols = row.find_all('td')
-            if len(cols) < 3:
-                continue
-            title_cell = cols[0]
-            title_a = title_cell.find('a')
-            project_title = title_a.get_text(strip=True) if title_a else title_cell.get_text(strip=True)
-            detail_url = BASE_URL + title_a['href'] if title_a and title_a.has_attr('href') else LIST_URL
-            published_date = normalize_date(cols[1].get_text(strip=True))
-            due_date = normalize_date(cols[2].get_text(strip=True))
-            print(f"🔄 Processing: {project_title}")
-            # Get summary from detail page
-            summary = ""
-            try:
-                driver.execute_script("window.open('');")
-                driver.switch_to.window(driver.window_handles[1])
-                driver.get(detail_url)
-                WebDriverWait(driver, SELENIUM_TIMEOUT).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.detail-content"))
-                )
-                time.sleep(1)
-                detail_soup = BeautifulSoup(driver.page_source, 'html.parser')
-                detail_content = detail_soup.find('div', class_='detail-content')
-                if detail_content:
-                    summary = detail_content.get_text("\n", strip=True)
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
-            except Exception as e:
-                print(f"  ⚠️  Error fetching detail: {e}")
-                if len(driver.window_handles) > 1:
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
-            bid = {
-                'project_title': project_title,
-                'scope_of_services': summary,
-                'published_date': published_date,
-                'due_date': due_date,
-                'detail_url': detail_url
-            }
-            bids.append(bid)
-            time.sleep(0.5)
-        df = pd.DataFrame(bids)
-        if not df.empty:
-            os.makedirs("compton", exist_ok=True)
-            df.to_csv(OUTPUT_CSV, index=False)
-            print(f"💾 Saved {len(df)} bids to {OUTPUT_CSV}")
+        content = _stream_detail_content(html)
+    except (etree.LxmlError, ValueError):
+        # Parse the whole page at once instead
+        nodes = _DETAIL_CONTENT_XPATH(lxml.html.fromstring(html, parser=_DETAIL_PARSER))
+        content = nodes[0] if nodes else None
+    if content is None:
+        return None
+    return "\n".join(text for text in map(str.strip, _VISIBLE_TEXT_XPATH(content)) if text)
+
+def _stream_detail_content(html):
+    """
+    Pull-parse a detail page until its first detail-content div is complete.
+
+    Elements closed before the div starts are cleared as they end, and the
+    rest of the page after the div is never parsed.
+
+    Args:
+        html: Detail page source
+
+    Returns:
+        Optional[Element]: The complete detail-content div, or None if the page has none
+    """
+    parser = etree.HTMLPullParser(events=('start', 'end'), remove_comments=True, collect_ids=False)
+
+    def events():
+        for offset in range(0, len(html), DETAIL_PARSE_CHUNK):
+            parser.feed(html[offset:offset + DETAIL_PARSE_CHUNK])
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    content = None
+    for event, element in events():
+        if event == 'start':
+            if content is None and element.tag == 'div' and 'detail-content' in (element.get('class') or '').split():
+                content = element
+        elif element is content:
+            return content
+        elif content is None:
+            element.clear()
+    return content
+
+async def fetch_detail_summary(client, url):
+    """
+    Fetch a bid detail page over plain HTTP and extract its summary.
+
+    Args:
+        client (httpx.AsyncClient): Shared pooled HTTP client
+        url (str): URL of the detail page
+
+    Returns:
+        Optional[str]: Summary text, or None if the page has no detail-content
+        block (e.g. a JavaScript challenge page)
+
+    Raises:
+        httpx.HTTPStatusError: If the page returns an error status
+        httpx.HTTPError: If the request fails or exceeds DETAIL_TIMEOUT
+    """
+    response = await client.get(url)
+    response.raise_for_status()
+    return parse_detail_summary(response.text)
+
+async def _gather_details(urls):
+    """
+    Fetch all detail pages concurrently over one pooled client, bounded by DETAIL_CONCURRENCY.
+
+    Args:
+        urls (List[str]): Detail page URLs
+
+    Returns:
+        List[Union[Optional[str], BaseException]]: Summaries in the same order
+        as urls; failed fetches are returned as their exception
+    """
+    semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+    limits = httpx.Limits(max_connections=DETAIL_CONCURRENCY, max_keepalive_connections=DETAIL_CONCURRENCY)
+
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=DETAIL_TIMEOUT,
+                                 headers=HTTP_HEADERS, follow_redirects=True) as client:
+        async def bounded_fetch(url):
+            async with semaphore:
+                return await fetch_detail_summary(client, url)
+
+        return await asyncio.gather(*(bounded_fetch(url) for url in urls), return_exceptions=True)
+
+def fetch_detail_summaries(urls):
+    """
+    Fetch the summaries of all detail pages over HTTP.
+
+    Detail pages are static HTML, so the browser is only needed for pages
+    that fail here.
+
+    Args:
+        urls (List[str]): Detail page URLs
+
+    Returns:
+        Dict[str, str]: URL -> summary for every page fetched successfully;
+        missing URLs should be loaded with Selenium instead
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    results = asyncio.run(_gather_details(unique_urls))
+    summaries = {}
+    for url, result in zip(unique_urls, results):
+        if isinstance(result, BaseException):
+            print(f"  ⚠️  HTTP fetch failed for {url}: {result}")
+        elif result is None:
+            print(f"  ⚠️  No detail content over HTTP for {url}")
         else:
-            print("❌ No bids found!")
+            summaries[url] = result
+    print(f"📥 Fetched {len(summaries)}/{len(unique_urls)} detail pages over HTTP")
+    return summaries
+
+def fetch_detail_with_browser(driver, detail_url):
+    """
+    Load a detail page in the browser's detail tab and extract its summary.
+
+    Used for pages that could not be fetched over HTTP. The detail tab is
+    opened on first use and reused for every later page (it is closed by
+    driver.quit()); the list tab is reselected whether or not the page loads.
+
+    Args:
+        driver: Selenium WebDriver showing the bid list
+        detail_url (str): URL of the detail page
+
+    Returns:
+        str: Summary text ("" if the page has no detail-content block)
+
+    Raises:
+        TimeoutException: If the detail-content block does not appear
+    """
+    if len(driver.window_handles) < 2:
+        driver.execute_script("window.open('about:blank');")
+    list_tab, detail_tab = driver.window_handles[:2]
+    driver.switch_to.window(detail_tab)
+    try:
+        driver.get(detail_url)
+        WebDriverWait(driver, SELENIUM_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.detail-content"))
+        )
+        return parse_detail_summary(driver.page_source) or ""
     finally:
-        driver.quit()
-        print("🔚 Browser closed")
+        driver.switch_to.window(list_tab)
 
-def scrape_all(date_filter=None):
+def _scrape_compton(date_filter=None):
     """
-    Main integration point for pipeline. Scrapes bids, filters by published_date >= date_filter (YYYY-MM-DD), returns DataFrame and error list.
+    Scrape the Compton bids list and detail pages, and save them to OUTPUT_CSV.
+
+    Shared by scrape_compton_bids() and scrape_all(), so a run launches at
+    most one browser.
+
+    Args:
+        date_filter (str): Only keep bids with published_date >= this
+            YYYY-MM-DD date (all bids if None)
+
+    Returns:
+        Tuple[pd.DataFrame, List[str]]: (bids, error messages)
     """
-    all_bids = []
+    bids = []
     errors = []
+    # Skip the browser entirely if the list page is unchanged since the last run
+    cached_bids, validators = load_cached_listing(LIST_URL, LIST_CACHE_PATH, variant=date_filter or "")
+    if cached_bids is not None:
+        df = pd.DataFrame(cached_bids)
+        os.makedirs("compton", exist_ok=True)
+        df.to_csv(OUTPUT_CSV, index=False)
+        print(f"💾 Saved {len(df)} bids to {OUTPUT_CSV}")
+        return df, errors
+    print(f"🌐 Fetching: {LIST_URL} (Selenium)")
     chrome_options = Options()
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--no-sandbox')
@@ -142,30 +306,28 @@ def scrape_all(date_filter=None):
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
-    service = Service(ChromeDriverManager().install())
+    # Only the page HTML is read, so skip downloading images
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    # Return from driver.get() at DOMContentLoaded; the list table is waited for explicitly
+    chrome_options.page_load_strategy = 'eager'
+    service = Service(get_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     try:
         driver.get(LIST_URL)
         WebDriverWait(driver, SELENIUM_TIMEOUT * 2).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "table.listtable tbody tr"))
         )
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = BeautifulSoup(driver.page_source, 'lxml')
         table = soup.find('table', class_='listtable')
         if not table:
+            print("❌ Could not find bids table!")
             errors.append("Could not find bids table!")
             return pd.DataFrame(), errors
         rows = table.find('tbody').find_all('tr')
-        for row in rows:
-            cols = row.find_all('td')
-            if len(cols) < 3:
-                continue
-            title_cell = cols[0]
-            title_a = title_cell.find('a')
-            project_title = title_a.get_text(strip=True) if title_a else title_cell.get_text(strip=True)
-            detail_url = BASE_URL + title_a['href'] if title_a and title_a.has_attr('href') else LIST_URL
-            published_date = normalize_date(cols[1].get_text(strip=True))
-            due_date = normalize_date(cols[2].get_text(strip=True))
+        print(f"📊 Found {len(rows)} bid rows in table")
+        listings = []
+        for project_title, detail_url, published_date, due_date in parse_list_rows(rows):
             # Date filtering
             if date_filter:
                 try:
@@ -176,26 +338,25 @@ def scrape_all(date_filter=None):
                 except Exception as e:
                     errors.append(f"Date filter error for {project_title}: {e}")
                     continue
-            summary = ""
-            try:
-                driver.execute_script("window.open('');")
-                driver.switch_to.window(driver.window_handles[1])
-                driver.get(detail_url)
-                WebDriverWait(driver, SELENIUM_TIMEOUT).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.detail-content"))
-                )
-                time.sleep(1)
-                detail_soup = BeautifulSoup(driver.page_source, 'html.parser')
-                detail_content = detail_soup.find('div', class_='detail-content')
-                if detail_content:
-                    summary = detail_content.get_text("\n", strip=True)
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
-            except Exception as e:
-                errors.append(f"Error fetching detail for {project_title}: {e}")
-                if len(driver.window_handles) > 1:
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
+            listings.append((project_title, detail_url, published_date, due_date))
+        summaries = fetch_detail_summaries([listing[1] for listing in listings])
+        last_browser_load = 0.0
+        for project_title, detail_url, published_date, due_date in listings:
+            print(f"🔄 Processing: {project_title}")
+            # Get summary from detail page, falling back to the browser
+            summary = summaries.get(detail_url)
+            if summary is None:
+                # Throttle browser loads only when the previous one was faster than the interval
+                elapsed = time.monotonic() - last_browser_load
+                if elapsed < BROWSER_MIN_INTERVAL:
+                    time.sleep(BROWSER_MIN_INTERVAL - elapsed)
+                last_browser_load = time.monotonic()
+                try:
+                    summary = fetch_detail_with_browser(driver, detail_url)
+                except Exception as e:
+                    print(f"  ⚠️  Error fetching detail: {e}")
+                    errors.append(f"Error fetching detail for {project_title}: {e}")
+                    summary = ""
             bid = {
                 'project_title': project_title,
                 'scope_of_services': summary,
@@ -203,15 +364,29 @@ def scrape_all(date_filter=None):
                 'due_date': due_date,
                 'detail_url': detail_url
             }
-            all_bids.append(bid)
-            time.sleep(0.5)
-        df = pd.DataFrame(all_bids)
+            bids.append(bid)
+        df = pd.DataFrame(bids)
         if not df.empty:
             os.makedirs("compton", exist_ok=True)
             df.to_csv(OUTPUT_CSV, index=False)
+            print(f"💾 Saved {len(df)} bids to {OUTPUT_CSV}")
+            if not errors:
+                save_cached_listing(LIST_CACHE_PATH, LIST_URL, validators, bids, variant=date_filter or "")
+        else:
+            print("❌ No bids found!")
         return df, errors
     finally:
         driver.quit()
+        print("🔚 Browser closed")
+
+def scrape_compton_bids():
+    _scrape_compton()
+
+def scrape_all(date_filter=None):
+    """
+    Main integration point for pipeline. Scrapes bids, filters by published_date >= date_filter (YYYY-MM-DD), returns DataFrame and error list.
+    """
+    return _scrape_compton(date_filter)
 
 def print_portal_summary(count, portal_name, error=None):
     if error:
@@ -21,7 +21,7 @@ Modified: 2025-11-09
 Dependencies:
     - selenium: Web automation and browser control
     - undetected-chromedriver: Anti-bot detection browser
-    - beautifulsoup4: HTML parsing and data extraction
+    - lxml: HTML parsing and data extraction
     - pandas: Data manipulation and CSV output
 
 Usage:
@@ -34,6 +34,7 @@ Usage:
 """
 
 # Standard library imports
+import functools
 import os
 import re
 import time
@@ -41,9 +42,10 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 # Third-party imports
+import lxml.html
 import pandas as pd
 import undetected_chromedriver as uc
-from bs4 import BeautifulSoup
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -66,6 +68,36 @@ PORTAL_URL = "https://customer.e-arc.com/arcEOC/Secures/PWELL_PrivateList.aspx?P
 
 # Output Configuration
 OUTPUT_CSV = "earc/earc_bids.csv"
+CSV_CHUNK_SIZE = 500  # Rows serialized per write when saving OUTPUT_CSV
+
+# Matches "LogintoProject('0-99-7')" with or without a "javascript:" prefix
+_ONCLICK_RE = re.compile(r"LogintoProject\(['\"]([^'\"]+)['\"]")
+
+# Placeholder values the grid shows in place of a date
+_EMPTY_DATES = frozenset({'Not Available', '', 'N/A'})
+
+# E-ARC date formats keyed by the number of whitespace-separated fields
+_DATE_FMT_BY_FIELDS = {
+    1: '%m/%d/%Y',           # "06/10/2021"
+    2: '%m/%d/%Y %H:%M',     # "06/10/2021 12:59"
+    3: '%m/%d/%Y %I:%M %p',  # "06/10/2021 12:59 PM"
+}
+
+# Serializes only the project grid in the browser (undefined if it is missing),
+# so the rest of the page is never copied out or parsed
+_GRID_HTML_JS = "(document.getElementById('divProjectGrid') || {}).outerHTML"
+
+# Project grid XPaths (class tests match whole class tokens, like BeautifulSoup's class_)
+_DATA_TABLE_XPATH = etree.XPath(
+    "(.//table[contains(concat(' ', normalize-space(@class), ' '), ' obj ')])[1]"
+)
+_ROW_XPATH = etree.XPath(
+    ".//tr[contains(concat(' ', normalize-space(@class), ' '), ' ev_light ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' odd_light ')]"
+)
+_CELLS_XPATH = etree.XPath(".//td")
+_LINK_XPATH = etree.XPath("(.//a)[1]")
+_CELL_TEXT_XPATH = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
 
 # =============================================================================
 # CORE SCRAPING FUNCTIONS
@@ -85,21 +117,30 @@ def extract_project_id_from_onclick(onclick_text: str) -> Optional[str]:
         return None
         
     # Look for patterns like "LogintoProject('0-99-7')" or "javascript:LogintoProject('0-99-7')"
-    patterns = [
-        r"LogintoProject\(['\"]([^'\"]+)['\"]",
-        r"javascript:\s*LogintoProject\(['\"]([^'\"]+)['\"]",
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, onclick_text)
-        if match:
-            return match.group(1)
+    match = _ONCLICK_RE.search(onclick_text)
+    if match:
+        return match.group(1)
     
     # Debug: print what we actually found
     print(f"   🔍 Debug onclick: {onclick_text}")
     return None
 
 
+def _cell_text(element) -> str:
+    """
+    Join the stripped text nodes under a grid element.
+
+    Matches BeautifulSoup's ``get_text(strip=True)``.
+
+    Args:
+        element: lxml element to read
+        
+    Returns:
+        str: Concatenated visible text
+    """
+    return ''.join(text.strip() for text in _CELL_TEXT_XPATH(element))
+
+
 def construct_detail_url(project_id: str) -> str:
     """
     Construct the detail URL for a project based on its ID.
@@ -115,9 +156,12 @@ def construct_detail_url(project_id: str) -> str:
     return f"https://customer.e-arc.com/arcEOC/Secures/PWELL_PrivateList.aspx?PrjType=pub&pid={project_id}"
 
 
+@functools.lru_cache(maxsize=2048)
 def parse_date_string(date_str: str) -> Optional[datetime]:
     """
     Parse E-ARC date strings into datetime objects.
+
+    Results are cached, since post and due dates repeat heavily across rows.
     
     Args:
         date_str (str): Date string from the portal
@@ -125,25 +169,23 @@ def parse_date_string(date_str: str) -> Optional[datetime]:
     Returns:
         Optional[datetime]: Parsed datetime or None if parsing fails
     """
-    if not date_str or date_str.strip() in ['Not Available', '', 'N/A']:
+    if not date_str:
         return None
         
     date_str = date_str.strip()
+    if date_str in _EMPTY_DATES:
+        return None
     
-    # Try common date formats found in E-ARC
-    formats = [
-        '%m/%d/%Y %I:%M %p',  # "06/10/2021 12:59 PM"
-        '%m/%d/%Y %H:%M',     # "06/10/2021 12:59"
-        '%m/%d/%Y',           # "06/10/2021"
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
+    # Only one E-ARC format can match a given field count, so go straight to it.
+    # Field count rather than length, since the portal doesn't always zero-pad.
+    fmt = _DATE_FMT_BY_FIELDS.get(len(date_str.split()))
+    if fmt is None:
+        return None
     
-    return None
+    try:
+        return datetime.strptime(date_str, fmt)
+    except ValueError:
+        return None
 
 
 def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
@@ -187,12 +229,15 @@ def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str,
             })
             return successful_bids, failed_pages
         
-        # Parse the page content
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        # Read just the project grid over the DevTools protocol
+        grid_html = driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': _GRID_HTML_JS,
+            'returnByValue': True
+        })['result'].get('value')
         
-        # Find the project grid table
-        project_grid = soup.find('div', {'id': 'divProjectGrid'})
-        if not project_grid:
+        # Parse the project grid table
+        project_grid = lxml.html.fromstring(grid_html) if grid_html else None
+        if project_grid is None:
             print("❌ Could not find project grid")
             failed_pages.append({
                 'url': PORTAL_URL,
@@ -202,8 +247,8 @@ def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str,
             return successful_bids, failed_pages
         
         # Find the data table within the grid
-        data_table = project_grid.find('table', class_='obj')
-        if not data_table:
+        data_table = next(iter(_DATA_TABLE_XPATH(project_grid)), None)
+        if data_table is None:
             print("❌ Could not find data table")
             failed_pages.append({
                 'url': PORTAL_URL,
@@ -213,7 +258,7 @@ def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str,
             return successful_bids, failed_pages
         
         # Find all data rows (skip header rows)
-        data_rows = data_table.find_all('tr', class_=['ev_light', 'odd_light'])
+        data_rows = _ROW_XPATH(data_table)
         print(f"📊 Found {len(data_rows)} project rows")
         
         # Process date filter
@@ -224,10 +269,11 @@ def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str,
         else:
             print("⚠️  No date filter provided - processing all projects")
         
-        # Extract data from each row
+        # Extract data from each row; successful rows are reported together after the loop
+        extracted_rows = []
         for idx, row in enumerate(data_rows, 1):
             try:
-                cells = row.find_all('td')
+                cells = _CELLS_XPATH(row)
                 if len(cells) < 8:  # Should have 8 columns based on the structure
                     print(f"⚠️  Row {idx}: Insufficient columns ({len(cells)}), skipping")
                     continue
@@ -237,13 +283,13 @@ def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str,
                 
                 # Project Number (contains the link and project ID)
                 project_number_cell = cells[1]
-                project_link = project_number_cell.find('a')
+                project_link = next(iter(_LINK_XPATH(project_number_cell)), None)
                 
-                if not project_link:
+                if project_link is None:
                     print(f"⚠️  Row {idx}: No project link found, skipping")
                     continue
                 
-                project_number = project_link.get_text(strip=True)
+                project_number = _cell_text(project_link)
                 onclick_attr = project_link.get('onclick', '')
                 href_attr = project_link.get('href', '')
                 
@@ -269,19 +315,11 @@ def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str,
                     continue
                 
                 # Extract other fields
-                project_name = cells[2].get_text(strip=True)
-                project_description = cells[3].get_text(strip=True)
-                due_date_str = cells[4].get_text(strip=True)
-                post_date_str = cells[5].get_text(strip=True)
-                company_name = cells[6].get_text(strip=True)
-                
-                # Parse dates
-                due_date = parse_date_string(due_date_str)
-                post_date = parse_date_string(post_date_str)
-                
-                # Apply date filter on post date
-                if filter_date and post_date and post_date < filter_date:
-                    continue
+                project_name = _cell_text(cells[2])
+                project_description = _cell_text(cells[3])
+                due_date_str = _cell_text(cells[4])
+                post_date_str = _cell_text(cells[5])
+                company_name = _cell_text(cells[6])
                 
                 # Construct detail URL
                 detail_url = construct_detail_url(project_id)
@@ -298,20 +336,10 @@ def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str,
                     'detail_url': detail_url,
                     'source_url': PORTAL_URL,
                     'scraped_at': datetime.now().isoformat(),
-                    
-                    # Airtable-compatible field mappings that match main.py expectations
-                    'Project Title': project_name or project_number,  # Use number as fallback
-                    'Summary': project_description or 'No description available',
-                    'bid_posting_date': post_date_str,  # For main.py field mapping
-                    'Release Date': post_date_str,       # Direct Airtable mapping
-                    'bid_due_date': due_date_str,        # For main.py field mapping  
-                    'Due Date': due_date_str,            # Direct Airtable mapping
-                    'detail_url': detail_url,            # For main.py field mapping
-                    'Link': detail_url                   # Direct Airtable mapping
                 }
                 
                 successful_bids.append(bid_record)
-                print(f"✅ Row {idx}: {project_number} - {project_name[:50]}...")
+                extracted_rows.append(f"✅ Row {idx}: {project_number} - {project_name[:50]}...")
                 
             except Exception as e:
                 print(f"❌ Row {idx}: Error extracting data - {str(e)}")
@@ -322,6 +350,20 @@ def scrape_earc_portal(driver, date_filter: str = None) -> Tuple[List[Dict[str,
                 })
                 continue
         
+        if extracted_rows:
+            print("\n".join(extracted_rows))
+        
+        # Apply date filter on post date in one vectorized pass; projects
+        # without a parseable post date are kept
+        if filter_date and successful_bids:
+            post_dates = pd.to_datetime(pd.Series(
+                [bid['post_date_str'] for bid in successful_bids]
+            ).map(parse_date_string))
+            keep = post_dates.isna() | (post_dates >= pd.Timestamp(filter_date))
+            filtered_count = len(successful_bids) - int(keep.sum())
+            successful_bids = [bid for bid, keep_bid in zip(successful_bids, keep) if keep_bid]
+            print(f"🗓️  Filtered out {filtered_count} projects posted before {date_filter}")
+        
         print(f"✅ E-ARC scraping completed: {len(successful_bids)} projects extracted")
         
     except Exception as e:
@@ -420,6 +462,17 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
         driver.quit()
         print("🔒 Browser session closed")
     
+    # Each retry can record the same failure again, so keep one entry per (url, reason)
+    seen_failures = set()
+    unique_failed_pages = []
+    for failed_page in all_failed_pages:
+        failure_key = (failed_page['url'], failed_page['reason'])
+        if failure_key not in seen_failures:
+            seen_failures.add(failure_key)
+            unique_failed_pages.append(failed_page)
+    all_failed_pages = unique_failed_pages
+    scraping_stats['failed_pages'] = all_failed_pages
+    
     # Save failed URLs if any
     if all_failed_pages:
         print(f"💾 Saving {len(all_failed_pages)} failed pages to failed_urls.txt")
@@ -429,12 +482,24 @@ def scrape_all(date_filter: str = None) -> Tuple[pd.DataFrame, Dict]:
     if all_bids:
         df = pd.DataFrame(all_bids)
         
+        # Airtable-compatible field mappings that match main.py expectations,
+        # added as whole columns rather than repeated in every bid record
+        df = df.assign(**{
+            'Project Title': df['project_title'].mask(df['project_title'] == '', df['project_number']),  # Use number as fallback
+            'Summary': df['project_description'].mask(df['project_description'] == '', 'No description available'),
+            'bid_posting_date': df['post_date_str'],  # For main.py field mapping
+            'Release Date': df['post_date_str'],      # Direct Airtable mapping
+            'bid_due_date': df['due_date_str'],       # For main.py field mapping
+            'Due Date': df['due_date_str'],           # Direct Airtable mapping
+            'Link': df['detail_url'],                 # Direct Airtable mapping
+        })
+        
         # Ensure output directory exists
         os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
         
         # Save raw CSV (not Airtable format - that's handled in main.py)
         print(f"💾 Saving E-ARC raw data to {OUTPUT_CSV}")
-        df.to_csv(OUTPUT_CSV, index=False)
+        df.to_csv(OUTPUT_CSV, index=False, chunksize=CSV_CHUNK_SIZE)
         
         print(f"✅ E-ARC scraper completed successfully")
         print(f"   📊 Total bids: {len(all_bids)}")
@@ -10,8 +10,10 @@ Usage:
     python elsegundo_scraper.py
 """
 
+import asyncio
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 from datetime import datetime
 import re
@@ -21,36 +23,185 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
+from utils import get_chromedriver_path
+
 BASE_URL = "https://www.elsegundo.org"
 LIST_URL = f"{BASE_URL}/government/departments/city-clerk/bid-rfp"
 OUTPUT_CSV = "elsegundo/elsegundo_bids.csv"
+CSV_CHUNK_SIZE = 500  # Rows serialized per write when saving OUTPUT_CSV
 SELENIUM_TIMEOUT = 20
+BROWSER_MIN_INTERVAL = 0.5  # Minimum seconds between browser detail page loads
+
+# Serializes only the detail-content div in the browser (undefined if missing)
+_DETAIL_HTML_JS = "(document.querySelector('div.detail-content') || {}).outerHTML"
+
+# Only the bids table / detail-content block of a page is parsed into a tree.
+# The strainer sees the unsplit class attribute, so match the class as a whole token.
+_LIST_TABLE = SoupStrainer('table', class_=re.compile(r'(?:^|\s)listtable(?:\s|$)'))
+_DETAIL_CONTENT = SoupStrainer('div', class_=re.compile(r'(?:^|\s)detail-content(?:\s|$)'))
+
+# Detail Page HTTP Configuration
+DETAIL_CONCURRENCY = 8  # Maximum simultaneous detail page requests
+DETAIL_TIMEOUT = SELENIUM_TIMEOUT
+HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    )
+}
+
+# Trailing time or comma suffix stripped by normalize_date, whichever starts first
+_DATE_SUFFIX_RE = re.compile(r'(?:\s+\d{1,2}:\d{2}\s*(?:AM|PM)|,).*$', re.IGNORECASE)
 
 # Utility to normalize date to YYYY-MM-DD
 
 def normalize_date(date_string):
     if not date_string:
         return ""
-    date_str = str(date_string).strip()
-    date_str = re.sub(r'\s+\d{1,2}:\d{2}\s*(AM|PM).*$', '', date_str, flags=re.IGNORECASE)
-    date_str = re.sub(r',.*$', '', date_str)
+    date_str = _DATE_SUFFIX_RE.sub('', str(date_string).strip())
     # Try MM/DD/YYYY
     try:
         dt = datetime.strptime(date_str, '%m/%d/%Y')
         return dt.strftime('%Y-%m-%d')
-    except:
+    except ValueError:
         pass
-    # Try MM/DD/YYYY H:MM AM/PM
+    # Try MM/DD/YYYY H:MM AM/PM (only reached for times the suffix pattern misses, e.g. "2:5 PM")
     try:
         dt = datetime.strptime(date_string, '%m/%d/%Y %I:%M %p')
         return dt.strftime('%Y-%m-%d')
-    except:
+    except (TypeError, ValueError):
         pass
     return date_string
 
+def parse_detail_summary(html):
+    """
+    Extract the summary text from an El Segundo bid detail page.
+
+    Args:
+        html: Detail page source
+
+    Returns:
+        Optional[str]: Newline-separated text of the detail-content block, or
+        None if the page has no such block
+    """
+    detail_content = BeautifulSoup(html, 'lxml', parse_only=_DETAIL_CONTENT).find('div', class_='detail-content')
+    if not detail_content:
+        return None
+    return detail_content.get_text("\n", strip=True)
+
+async def fetch_detail_summary(client, url):
+    """
+    Fetch a bid detail page over plain HTTP and extract its summary.
+
+    Args:
+        client (httpx.AsyncClient): Shared pooled HTTP client
+        url (str): URL of the detail page
+
+    Returns:
+        Optional[str]: Summary text, or None if the page has no detail-content
+        block (e.g. a JavaScript challenge page)
+
+    Raises:
+        httpx.HTTPStatusError: If the page returns an error status
+        httpx.HTTPError: If the request fails or exceeds DETAIL_TIMEOUT
+    """
+    response = await client.get(url)
+    response.raise_for_status()
+    return parse_detail_summary(response.text)
+
+async def _gather_details(urls, cookies):
+    """
+    Fetch all detail pages concurrently over one pooled client, bounded by DETAIL_CONCURRENCY.
+
+    Args:
+        urls (List[str]): Detail page URLs
+        cookies (httpx.Cookies): Browser session cookies sent with every request
+
+    Returns:
+        List[Union[Optional[str], BaseException]]: Summaries in the same order
+        as urls; failed fetches are returned as their exception
+    """
+    semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+    limits = httpx.Limits(max_connections=DETAIL_CONCURRENCY, max_keepalive_connections=DETAIL_CONCURRENCY)
+
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=DETAIL_TIMEOUT, headers=HTTP_HEADERS,
+                                 cookies=cookies, follow_redirects=True) as client:
+        async def bounded_fetch(url):
+            async with semaphore:
+                return await fetch_detail_summary(client, url)
+
+        return await asyncio.gather(*(bounded_fetch(url) for url in urls), return_exceptions=True)
+
+def fetch_detail_summaries(driver, urls):
+    """
+    Fetch the summaries of all detail pages over HTTP, reusing the browser's cookies.
+
+    Detail pages are static HTML, so the browser is only needed for pages
+    that fail here.
+
+    Args:
+        driver: Selenium WebDriver that loaded the bid list
+        urls (List[str]): Detail page URLs
+
+    Returns:
+        Dict[str, str]: URL -> summary for every page fetched successfully;
+        missing URLs should be loaded with Selenium instead
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    cookies = httpx.Cookies()
+    for cookie in driver.get_cookies():
+        cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+    results = asyncio.run(_gather_details(unique_urls, cookies))
+    summaries = {}
+    for url, result in zip(unique_urls, results):
+        if isinstance(result, BaseException):
+            print(f"  ⚠️  HTTP fetch failed for {url}: {result}")
+        elif result is None:
+            print(f"  ⚠️  No detail content over HTTP for {url}")
+        else:
+            summaries[url] = result
+    print(f"📥 Fetched {len(summaries)}/{len(unique_urls)} detail pages over HTTP")
+    return summaries
+
+def fetch_detail_with_browser(driver, detail_url):
+    """
+    Load a detail page in a new browser tab and extract its summary.
+
+    Used for pages that could not be fetched over HTTP. The tab is closed and
+    the list tab reselected whether or not the page loads.
+
+    Args:
+        driver: Selenium WebDriver showing the bid list
+        detail_url (str): URL of the detail page
+
+    Returns:
+        str: Summary text ("" if the page has no detail-content block)
+
+    Raises:
+        TimeoutException: If the detail-content block does not appear
+    """
+    try:
+        driver.execute_script("window.open('');")
+        driver.switch_to.window(driver.window_handles[1])
+        driver.get(detail_url)
+        WebDriverWait(driver, SELENIUM_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.detail-content"))
+        )
+        time.sleep(1)
+        detail_html = driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': _DETAIL_HTML_JS,
+            'returnByValue': True
+        })['result'].get('value') or ''
+        return parse_detail_summary(detail_html) or ""
+    finally:
+        if len(driver.window_handles) > 1:
+            driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+
 def scrape_elsgundo_bids():
     print(f"🌐 Fetching: {LIST_URL} (Selenium)")
     chrome_options = Options()
@@ -62,7 +213,7 @@ def scrape_elsgundo_bids():
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
-    service = Service(ChromeDriverManager().install())
+    service = Service(get_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     bids = []
     try:
@@ -79,13 +230,14 @@ def scrape_elsgundo_bids():
             print("🔚 Browser closed")
             return
         time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = BeautifulSoup(driver.page_source, 'lxml', parse_only=_LIST_TABLE)
         table = soup.find('table', class_='listtable')
         if not table:
             print("❌ Could not find bids table!")
             return
         rows = table.find('tbody').find_all('tr')
         print(f"📊 Found {len(rows)} bid rows in table")
+        listings = []
         for row in rows:
             cols = row.find_all('td')
             if len(cols) < 4:
@@ -96,28 +248,24 @@ def scrape_elsgundo_bids():
             detail_url = BASE_URL + title_a['href'] if title_a and title_a.has_attr('href') else LIST_URL
             published_date = normalize_date(cols[2].get_text(strip=True))
             due_date = normalize_date(cols[3].get_text(strip=True))
+            listings.append((project_title, detail_url, published_date, due_date))
+        summaries = fetch_detail_summaries(driver, [listing[1] for listing in listings])
+        last_browser_load = 0.0
+        for project_title, detail_url, published_date, due_date in listings:
             print(f"🔄 Processing: {project_title}")
-            # Get summary from detail page
-            summary = ""
-            try:
-                driver.execute_script("window.open('');")
-                driver.switch_to.window(driver.window_handles[1])
-                driver.get(detail_url)
-                WebDriverWait(driver, SELENIUM_TIMEOUT).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.detail-content"))
-                )
-                time.sleep(1)
-                detail_soup = BeautifulSoup(driver.page_source, 'html.parser')
-                detail_content = detail_soup.find('div', class_='detail-content')
-                if detail_content:
-                    summary = detail_content.get_text("\n", strip=True)
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
-            except Exception as e:
-                print(f"  ⚠️  Error fetching detail: {e}")
-                if len(driver.window_handles) > 1:
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
+            # Get summary from detail page, falling back to the browser
+            summary = summaries.get(detail_url)
+            if summary is None:
+                # Throttle browser loads only when the previous one was faster than the interval
+                elapsed = time.monotonic() - last_browser_load
+                if elapsed < BROWSER_MIN_INTERVAL:
+                    time.sleep(BROWSER_MIN_INTERVAL - elapsed)
+                last_browser_load = time.monotonic()
+                try:
+                    summary = fetch_detail_with_browser(driver, detail_url)
+                except Exception as e:
+                    print(f"  ⚠️  Error fetching detail: {e}")
+                    summary = ""
             bid = {
                 'project_title': project_title,
                 'scope_of_services': summary,
@@ -126,12 +274,11 @@ def scrape_elsgundo_bids():
                 'detail_url': detail_url
             }
             bids.append(bid)
-            time.sleep(0.5)
         df = pd.DataFrame(bids)
         if not df.empty:
             import os
             os.makedirs("elsegundo", exist_ok=True)
-            df.to_csv(OUTPUT_CSV, index=False)
+            df.to_csv(OUTPUT_CSV, index=False, chunksize=CSV_CHUNK_SIZE)
             print(f"💾 Saved {len(df)} bids to {OUTPUT_CSV}")
         else:
             print("❌ No bids found!")
@@ -153,7 +300,7 @@ def scrape_all(date_filter=None):
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
-    service = Service(ChromeDriverManager().install())
+    service = Service(get_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     try:
         driver.get(LIST_URL)
@@ -166,12 +313,13 @@ def scrape_all(date_filter=None):
             driver.quit()
             return pd.DataFrame(), errors
         time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = BeautifulSoup(driver.page_source, 'lxml', parse_only=_LIST_TABLE)
         table = soup.find('table', class_='listtable')
         if not table:
             errors.append("Could not find bids table!")
             return pd.DataFrame(), errors
         rows = table.find('tbody').find_all('tr')
+        listings = []
         for row in rows:
             cols = row.find_all('td')
             if len(cols) < 4:
@@ -192,26 +340,23 @@ def scrape_all(date_filter=None):
                 except Exception as e:
                     errors.append(f"Date filter error for {project_title}: {e}")
                     continue
-            summary = ""
-            try:
-                driver.execute_script("window.open('');")
-                driver.switch_to.window(driver.window_handles[1])
-                driver.get(detail_url)
-                WebDriverWait(driver, SELENIUM_TIMEOUT).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.detail-content"))
-                )
-                time.sleep(1)
-                detail_soup = BeautifulSoup(driver.page_source, 'html.parser')
-                detail_content = detail_soup.find('div', class_='detail-content')
-                if detail_content:
-                    summary = detail_content.get_text("\n", strip=True)
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
-            except Exception as e:
-                errors.append(f"Error fetching detail for {project_title}: {e}")
-                if len(driver.window_handles) > 1:
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
+            listings.append((project_title, detail_url, published_date, due_date))
+        summaries = fetch_detail_summaries(driver, [listing[1] for listing in listings])
+        last_browser_load = 0.0
+        for project_title, detail_url, published_date, due_date in listings:
+            # Get summary from detail page, falling back to the browser
+            summary = summaries.get(detail_url)
+            if summary is None:
+                # Throttle browser loads only when the previous one was faster than the interval
+                elapsed = time.monotonic() - last_browser_load
+                if elapsed < BROWSER_MIN_INTERVAL:
+                    time.sleep(BROWSER_MIN_INTERVAL - elapsed)
+                last_browser_load = time.monotonic()
+                try:
+                    summary = fetch_detail_with_browser(driver, detail_url)
+                except Exception as e:
+                    errors.append(f"Error fetching detail for {project_title}: {e}")
+                    summary = ""
             bid = {
                 'project_title': project_title,
                 'scope_of_services': summary,
@@ -220,12 +365,11 @@ def scrape_all(date_filter=None):
                 'detail_url': detail_url
             }
             bids.append(bid)
-            time.sleep(0.5)
         df = pd.DataFrame(bids)
         if not df.empty:
             import os
             os.makedirs("elsegundo", exist_ok=True)
-            df.to_csv(OUTPUT_CSV, index=False)
+            df.to_csv(OUTPUT_CSV, index=False, chunksize=CSV_CHUNK_SIZE)
         return df, errors
     finally:
         driver.quit()
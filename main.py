@@ -14,7 +14,9 @@ Usage:
 
 import os
 import pandas as pd
-from typing import Dict, List, Any
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import logging
 import sys
 
@@ -26,9 +28,12 @@ FILTER_DAYS = 42  # Only scrape bids from last X days
 cutoff_date = datetime.now() - timedelta(days=FILTER_DAYS)
 BID_FILTER_DATE = cutoff_date.strftime("%m/%d/%Y")
 
+# Scrapers run concurrently; each worker drives its own Chrome (~300MB each)
+MAX_SCRAPER_WORKERS = 4
+
 # Local imports
-from planet_bids import scrape_all as planet_bids_scrape_all
-from opengov import scrape_all as opengov_scrape_all
+from planet_bids import URLS as PLANET_URLS, scrape_all as planet_bids_scrape_all
+from opengov import URLS as OPENGOV_URLS, scrape_all as opengov_scrape_all
 from artesia_scraper import scrape_all as artesia_scrape_all
 from bell_gardens_scraper import scrape_all as bell_gardens_scrape_all
 from calabasas_scraper import scrape_all as calabasas_scrape_all
@@ -40,7 +45,7 @@ from san_gabriel_scraper import scrape_all as san_gabriel_scrape_all
 from questcdn_scraper import scrape_all as questcdn_scrape_all
 from elsegundo_scraper import scrape_all as elsegundo_scrape_all
 from compton_scraper import scrape_all as compton_scrape_all
-from utils import clear_failed_urls_file, upload_dataframe_to_airtable, query_llm, save_airtable_format_csv, save_failed_pages_batch
+from utils import clear_failed_urls_file, get_shared_driver, upload_dataframe_to_airtable, query_llm, save_airtable_format_csv, save_failed_pages_batch
 
 
 # Set up normalized logging for all scrapers
@@ -210,6 +215,65 @@ def prepare_airtable_data(df: pd.DataFrame, source: str) -> pd.DataFrame:
     return result_df
 
 
+def scrape_with_shared_driver(scrape_all: Callable, **kwargs) -> Tuple[pd.DataFrame, Dict]:
+    """Run a driver-aware scraper on the calling thread's shared Chrome session."""
+    with get_shared_driver() as driver:
+        return scrape_all(driver=driver, **kwargs)
+
+
+def run_all_cities(
+    scrapers: Dict[str, Callable[[], Tuple[pd.DataFrame, Dict]]],
+    serial_scrapers: Optional[Dict[str, Callable[[], Tuple[pd.DataFrame, Dict]]]] = None
+) -> Dict[str, Future]:
+    """
+    Run independent portal scrapers concurrently.
+
+    Scraping is dominated by page loads, so overlapping portals cuts total
+    runtime roughly by the worker count. Each worker thread owns its own
+    browser session; failures are logged here and re-raised by
+    ``Future.result()`` so callers keep their per-portal error handling.
+
+    Interactive portals (CAPTCHA / manual login prompts on stdin) and
+    portals that launch undetected_chromedriver, which patches one shared
+    chromedriver binary on startup, must not overlap each other. They are
+    passed as ``serial_scrapers`` and run one at a time on the calling
+    thread while the pool works through the other portals.
+
+    Args:
+        scrapers (Dict[str, Callable]): Portal name -> zero-argument callable
+            returning ``(df, stats)``, safe to run in parallel
+        serial_scrapers (Dict[str, Callable]): Portal name -> zero-argument
+            callable returning ``(df, stats)``, run one at a time
+
+    Returns:
+        Dict[str, Future]: Portal name -> completed future of ``(df, stats)``
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=MAX_SCRAPER_WORKERS) as executor:
+        futures = {}
+        for name, scrape in scrapers.items():
+            log_status(name, 'Start', f'Starting {name} scraper...')
+            futures[executor.submit(scrape)] = name
+        for name, scrape in (serial_scrapers or {}).items():
+            log_status(name, 'Start', f'Starting {name} scraper...')
+            future = Future()
+            try:
+                future.set_result(scrape())
+                log_status(name, 'Scrape', 'Finished')
+            except Exception as e:
+                future.set_exception(e)
+                log_status(name, 'Scrape', f'Failed: {e}', level='error')
+            results[name] = future
+        for future in as_completed(futures):
+            name = futures[future]
+            if future.exception():
+                log_status(name, 'Scrape', f'Failed: {future.exception()}', level='error')
+            else:
+                log_status(name, 'Scrape', 'Finished')
+    results.update({name: future for future, name in futures.items()})
+    return results
+
+
 def main() -> None:
     """
     Main application entry point.
@@ -259,11 +323,24 @@ def main() -> None:
         # 'earc': {'success': False, 'records': 0, 'errors': []}  # Disabled pending client input
     }
     
-    # Run PlanetBids scraper
-    log_status('PlanetBids', 'Start', 'Starting PlanetBids scraper...')
+    # Run the non-interactive portal scrapers concurrently, then merge results portal by portal.
+    # Portals that prompt on stdin (CAPTCHA / manual login) or launch uc.Chrome run one at a time.
+    city_results = run_all_cities({
+        'Artesia': partial(scrape_with_shared_driver, artesia_scrape_all, date_filter=BID_FILTER_DATE),
+        'Bell Gardens': partial(scrape_with_shared_driver, bell_gardens_scrape_all, date_filter=BID_FILTER_DATE),
+        'Calabasas': partial(calabasas_scrape_all, date_filter=BID_FILTER_DATE),
+        'QuestCDN': partial(questcdn_scrape_all, date_filter=BID_FILTER_DATE),
+    }, serial_scrapers={
+        'PlanetBids': partial(planet_bids_scrape_all, PLANET_URLS, date_filter=BID_FILTER_DATE),
+        'OpenGov': partial(opengov_scrape_all, OPENGOV_URLS, date_filter=BID_FILTER_DATE),
+        'BidNet': partial(bidnet_scrape_all, date_filter=BID_FILTER_DATE),
+        'Inglewood': partial(inglewood_scrape_all, date_filter=BID_FILTER_DATE),
+        'San Gabriel': partial(san_gabriel_scrape_all, date_filter=BID_FILTER_DATE),
+    })
+
+    # PlanetBids results
     try:
-        from planet_bids import URLS as PLANET_URLS
-        planet_df, planet_stats = planet_bids_scrape_all(PLANET_URLS, date_filter=BID_FILTER_DATE)
+        planet_df, planet_stats = city_results['PlanetBids'].result()
         if not planet_df.empty:
             log_status('PlanetBids', 'Scrape', f'Raw data: {len(planet_df)} records')
             planet_airtable = prepare_airtable_data(planet_df, 'PlanetBids')
@@ -287,11 +364,9 @@ def main() -> None:
         log_status('PlanetBids', 'Error', error_msg, level='error')
         scraping_summary['planetbids']['errors'].append(error_msg)
 
-    # Run OpenGov scraper
-    log_status('OpenGov', 'Start', 'Starting OpenGov scraper...')
+    # OpenGov results
     try:
-        from opengov import URLS as OPENGOV_URLS
-        opengov_df, opengov_stats = opengov_scrape_all(OPENGOV_URLS, date_filter=BID_FILTER_DATE)
+        opengov_df, opengov_stats = city_results['OpenGov'].result()
         if not opengov_df.empty:
             log_status('OpenGov', 'Scrape', f'Raw data: {len(opengov_df)} records')
             opengov_airtable = prepare_airtable_data(opengov_df, 'OpenGov')
@@ -315,10 +390,9 @@ def main() -> None:
         log_status('OpenGov', 'Error', error_msg, level='error')
         scraping_summary['opengov']['errors'].append(error_msg)
 
-    # Run Artesia scraper
-    log_status('Artesia', 'Start', 'Starting Artesia scraper...')
+    # Artesia results
     try:
-        artesia_df, artesia_stats = artesia_scrape_all(date_filter=BID_FILTER_DATE)
+        artesia_df, artesia_stats = city_results['Artesia'].result()
         if not artesia_df.empty:
             log_status('Artesia', 'Scrape', f'Raw data: {len(artesia_df)} records')
             artesia_airtable = prepare_airtable_data(artesia_df, 'Artesia')
@@ -342,10 +416,9 @@ def main() -> None:
         log_status('Artesia', 'Error', error_msg, level='error')
         scraping_summary['artesia']['errors'].append(error_msg)
 
-    # Run Bell Gardens scraper
-    log_status('Bell Gardens', 'Start', 'Starting Bell Gardens scraper...')
+    # Bell Gardens results
     try:
-        bell_gardens_df, bell_gardens_stats = bell_gardens_scrape_all(date_filter=BID_FILTER_DATE)
+        bell_gardens_df, bell_gardens_stats = city_results['Bell Gardens'].result()
         if not bell_gardens_df.empty:
             log_status('Bell Gardens', 'Scrape', f'Raw data: {len(bell_gardens_df)} records')
             bell_gardens_airtable = prepare_airtable_data(bell_gardens_df, 'Bell Gardens')
@@ -369,10 +442,9 @@ def main() -> None:
         log_status('Bell Gardens', 'Error', error_msg, level='error')
         scraping_summary['bell_gardens']['errors'].append(error_msg)
 
-    # Run Calabasas scraper
-    log_status('Calabasas', 'Start', 'Starting Calabasas scraper...')
+    # Calabasas results
     try:
-        calabasas_df, calabasas_stats = calabasas_scrape_all(date_filter=BID_FILTER_DATE)
+        calabasas_df, calabasas_stats = city_results['Calabasas'].result()
         if not calabasas_df.empty:
             log_status('Calabasas', 'Scrape', f'Raw data: {len(calabasas_df)} records')
             calabasas_airtable = prepare_airtable_data(calabasas_df, 'Calabasas')
@@ -396,10 +468,9 @@ def main() -> None:
         log_status('Calabasas', 'Error', error_msg, level='error')
         scraping_summary['calabasas']['errors'].append(error_msg)
 
-    # Run BidNet Direct scraper (Santa Clarita)
-    log_status('BidNet', 'Start', 'Starting BidNet Direct scraper...')
+    # BidNet Direct results (Santa Clarita)
     try:
-        bidnet_df, bidnet_stats = bidnet_scrape_all(date_filter=BID_FILTER_DATE)
+        bidnet_df, bidnet_stats = city_results['BidNet'].result()
         if not bidnet_df.empty:
             log_status('BidNet', 'Scrape', f'Raw data: {len(bidnet_df)} records')
             bidnet_airtable = prepare_airtable_data(bidnet_df, 'BidNet Direct')
@@ -423,10 +494,9 @@ def main() -> None:
         log_status('BidNet', 'Error', error_msg, level='error')
         scraping_summary['bidnet']['errors'].append(error_msg)
 
-    # Run Inglewood scraper
-    log_status('Inglewood', 'Start', 'Starting Inglewood scraper...')
+    # Inglewood results
     try:
-        inglewood_df, inglewood_stats = inglewood_scrape_all(date_filter=BID_FILTER_DATE)
+        inglewood_df, inglewood_stats = city_results['Inglewood'].result()
         if not inglewood_df.empty:
             log_status('Inglewood', 'Scrape', f'Raw data: {len(inglewood_df)} records')
             inglewood_airtable = pd.DataFrame(prepare_airtable_data(inglewood_df, 'Inglewood'))
@@ -450,10 +520,9 @@ def main() -> None:
         log_status('Inglewood', 'Error', error_msg, level='error')
         scraping_summary['inglewood']['errors'].append(error_msg)
 
-    # Run San Gabriel scraper
-    log_status('San Gabriel', 'Start', 'Starting San Gabriel scraper...')
+    # San Gabriel results
     try:
-        san_gabriel_df, san_gabriel_stats = san_gabriel_scrape_all(date_filter=BID_FILTER_DATE)
+        san_gabriel_df, san_gabriel_stats = city_results['San Gabriel'].result()
         if not san_gabriel_df.empty:
             log_status('San Gabriel', 'Scrape', f'Raw data: {len(san_gabriel_df)} records')
             from san_gabriel_scraper import prepare_airtable_format
@@ -520,10 +589,9 @@ def main() -> None:
     #     scraping_summary['earc']['errors'].append(error_msg)
     # =============================================================================
     
-    # Run QuestCDN scraper
-    log_status('QuestCDN', 'Start', 'Starting QuestCDN scraper...')
+    # QuestCDN results
     try:
-        questcdn_df, questcdn_stats = questcdn_scrape_all(date_filter=BID_FILTER_DATE)
+        questcdn_df, questcdn_stats = city_results['QuestCDN'].result()
         if not questcdn_df.empty:
             log_status('QuestCDN', 'Scrape', f'Raw data: {len(questcdn_df)} records')
             questcdn_airtable = prepare_airtable_data(questcdn_df, 'QuestCDN')
@@ -15,18 +15,26 @@ Dependencies:
 """
 
 # Standard library imports
+import atexit
+import contextlib
 import csv
 import datetime
+import functools
+import json
 import os
 import stat
+import threading
 import time
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple
 
 # Third-party imports
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -34,7 +42,23 @@ from selenium.webdriver.support.ui import WebDriverWait
 # Load environment variables
 load_dotenv()
 
+# Browser sessions shared across scrapers, one per thread (see get_shared_driver)
+_THREAD_DRIVERS = threading.local()
 
+# Column layout of the per-scraper Airtable CSV files
+AIRTABLE_CSV_HEADERS = ["Project Name", "Summary", "Published Date", "Due Date", "Link"]
+
+# Conditional listing page requests (see load_cached_listing)
+LISTING_CHECK_TIMEOUT = 15  # seconds
+LISTING_CHECK_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    )
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_chromedriver_path():
     """
     Get the correct ChromeDriver path, fixing webdriver-manager bugs.
@@ -47,6 +71,9 @@ def get_chromedriver_path():
         it sometimes returns the path to THIRD_PARTY_NOTICES.chromedriver
         instead of the actual chromedriver executable. It also ensures the
         executable has proper permissions.
+        
+        The path is resolved once per process; ChromeDriverManager().install()
+        queries the network for the current driver version on every call.
     """
     from webdriver_manager.chrome import ChromeDriverManager
     
@@ -68,9 +95,81 @@ def get_chromedriver_path():
     return chromedriver_path
 
 
+def build_chrome_options() -> Options:
+    """
+    Build Chrome options for scraping: headless, with images, extensions and
+    notifications disabled since only the page HTML is read.
+
+    Returns:
+        Options: Chrome options for webdriver.Chrome
+    """
+    chrome_options = Options()
+    chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    # Return from driver.get() at DOMContentLoaded
+    chrome_options.page_load_strategy = 'eager'
+    return chrome_options
+
+
+def create_chrome_driver() -> webdriver.Chrome:
+    """
+    Start a new Chrome session using build_chrome_options().
+
+    Returns:
+        webdriver.Chrome: New browser session (the caller must quit it)
+
+    Note:
+        ChromeDriver's own log is discarded to avoid disk I/O.
+    """
+    return webdriver.Chrome(
+        service=ChromeService(get_chromedriver_path(), log_output=os.devnull),
+        options=build_chrome_options()
+    )
+
+
+@contextlib.contextmanager
+def get_shared_driver() -> Iterator[webdriver.Chrome]:
+    """
+    Provide a Chrome session shared by every scraper run on the calling thread.
+
+    The browser is started on first use and quit automatically at
+    interpreter exit, so its 2-5s startup is paid once per thread instead of
+    once per scraper. Each thread gets its own session because WebDriver
+    sessions are not thread-safe. Cookies are cleared each time an existing
+    session is handed out so portals don't see each other's state.
+
+    Yields:
+        webdriver.Chrome: The calling thread's browser session
+
+    Example:
+        >>> with get_shared_driver() as driver:
+        ...     df, stats = artesia_scrape_all(driver=driver)
+    """
+    driver = getattr(_THREAD_DRIVERS, 'driver', None)
+    if driver is None:
+        driver = create_chrome_driver()
+        atexit.register(driver.quit)
+        _THREAD_DRIVERS.driver = driver
+    else:
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    yield driver
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_mmddyyyy(date_str: str) -> Optional[datetime.date]:
     """
     Parse date string in mm/dd/yyyy format to datetime.date object.
+
+    Results are cached, since scrapers parse the same filter and bid dates
+    repeatedly within a run.
     
     Args:
         date_str (str): Date string in format "mm/dd/yyyy" (e.g., "01/15/2025")
@@ -869,12 +968,14 @@ def clear_failed_urls_file(filename: str = "failed_urls.txt"):
         print(f"⚠️  Warning: Could not clear {filename}: {e}")
 
 
-def save_airtable_format_csv(items: List[Dict], filename: str, source_name: str) -> None:
+def save_airtable_format_csv(items, filename: str, source_name: str) -> None:
     """
     Save bid records in Airtable-compatible CSV format (5 columns, no Date Scraped).
     
     Args:
-        items (List[Dict]): List of bid records (in Airtable format)
+        items (List[Dict] | pd.DataFrame): Bid records (in Airtable format). A
+            DataFrame is written directly by pandas' C writer, without first
+            converting it to a list of dicts
         filename (str): Output CSV filename (with path)
         source_name (str): Name of the scraper/source for logging
         
@@ -883,30 +984,113 @@ def save_airtable_format_csv(items: List[Dict], filename: str, source_name: str)
     """
     import csv
     import os
-    if not items:
+    if len(items) == 0:
         print(f"✗ No {source_name} items to save")
         return
     print(f"💾 Saving {source_name} data to {filename}...")
     os.makedirs(os.path.dirname(filename), exist_ok=True)
-    headers = ["Project Name", "Summary", "Published Date", "Due Date", "Link"]
+    headers = AIRTABLE_CSV_HEADERS
     try:
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            for item in items:
-                row = [
-                    item.get("Project Name", ""),
-                    item.get("Summary", ""),
-                    item.get("Published Date", ""),
-                    item.get("Due Date", ""),
-                    item.get("Link", "")
-                ]
-                writer.writerow(row)
+        if isinstance(items, pd.DataFrame):
+            # Same layout as the csv.writer path: missing columns/values blank, CRLF rows
+            items.reindex(columns=headers).to_csv(
+                filename, index=False, encoding="utf-8", lineterminator="\r\n"
+            )
+        else:
+            with open(filename, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                for item in items:
+                    row = [
+                        item.get("Project Name", ""),
+                        item.get("Summary", ""),
+                        item.get("Published Date", ""),
+                        item.get("Due Date", ""),
+                        item.get("Link", "")
+                    ]
+                    writer.writerow(row)
         print(f"✓ Successfully saved {len(items)} {source_name} records to {filename}")
     except Exception as e:
         print(f"✗ Failed to save {source_name} data to {filename}: {e}")
 
 
+def load_cached_listing(url: str, cache_path: str,
+                        variant: str = "") -> Tuple[Optional[List[Dict]], Dict[str, str]]:
+    """
+    Check with a conditional GET whether a listing page changed since the last run.
+
+    The ETag / Last-Modified validators stored by save_cached_listing() are
+    sent as If-None-Match / If-Modified-Since. On a 304 response the records
+    saved for that run are returned, so the caller can skip the browser.
+
+    Args:
+        url (str): Listing page URL
+        cache_path (str): JSON file written by save_cached_listing()
+        variant (str): Scrape parameters the records depend on (e.g. the date
+            filter); cached records are only reused for the same variant
+
+    Returns:
+        Tuple[Optional[List[Dict]], Dict[str, str]]: Cached records (None if the
+        page has to be scraped) and the validators of a 200 response, to be
+        passed to save_cached_listing() once the scrape succeeds
+    """
+    cache = {}
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    headers = dict(LISTING_CHECK_HEADERS)
+    if cache.get('url') == url and cache.get('variant') == variant and 'records' in cache:
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+
+    try:
+        response = requests.get(url, headers=headers, timeout=LISTING_CHECK_TIMEOUT)
+    except requests.RequestException as e:
+        print(f"⚠️  Could not check {url} for changes: {e}")
+        return None, {}
+
+    if response.status_code == 304 and len(headers) > len(LISTING_CHECK_HEADERS):
+        print(f"♻️  {url} unchanged since last run (HTTP 304)")
+        return cache['records'], {}
+    if not response.ok:
+        return None, {}
+    validators = {
+        'etag': response.headers.get('ETag', ''),
+        'last_modified': response.headers.get('Last-Modified', '')
+    }
+    return None, validators
+
+
+def save_cached_listing(cache_path: str, url: str, validators: Dict[str, str],
+                        records: List[Dict], variant: str = "") -> None:
+    """
+    Store the records scraped from a listing page with its HTTP validators.
+
+    Nothing is written when the page sent neither an ETag nor a Last-Modified
+    header, since it could never be answered with a 304.
+
+    Args:
+        cache_path (str): JSON file to write
+        url (str): Listing page URL
+        validators (Dict[str, str]): Validators returned by load_cached_listing()
+        records (List[Dict]): JSON-serializable records scraped from the page
+        variant (str): Scrape parameters the records depend on
+    """
+    if not any(validators.values()):
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'variant': variant, **validators, 'records': records}, f)
+    except OSError as e:
+        print(f"⚠️  Warning: Could not save listing cache {cache_path}: {e}")
+
+
 # =============================================================================
 # PREDEFINED FIELD MAPPINGS FOR COMMON SCRAPERS
 # =============================================================================